@@ -3,8 +3,11 @@
 Edit Word documents with support for tracked changes.
 
 Usage:
-    uvx --with defusedxml python docx_edit.py --folder unpacked/ --action replace \
+    uvx --with lxml python docx_edit.py --folder unpacked/ --action replace \
         --find "old text" --replace "new text" --track-changes --author "Your Name"
+    uvx --with lxml python docx_edit.py --folder unpacked/ --action replace \
+        --pairs pairs.json
+    uvx --with lxml python docx_edit.py --folder unpacked/ --ops ops.json
 
 Actions:
     replace     Find and replace text
@@ -13,10 +16,20 @@ Actions:
 
 This script modifies the XML files in an unpacked DOCX folder.
 Use docx_pack.py to create the final .docx file.
+
+Pass --input instead of --folder to edit a .docx directly in memory:
+    uvx --with lxml python docx_edit.py --input report.docx --output edited.docx \
+        --action replace --find "old text" --replace "new text"
 """
 
+import os
+import re
 import sys
+import json
 import argparse
+import shutil
+import tempfile
+import zipfile
 from pathlib import Path
 
 # Add parent directory to path for utils import
@@ -31,11 +44,19 @@ from utils.ooxml_helpers import (
     create_tracked_insertion,
     create_tracked_deletion,
     create_run,
-    get_next_change_id,
+    get_next_change_id_from_bytes,
+    get_timestamp,
     enable_track_changes,
-    NAMESPACES,
+    enable_track_changes_xml,
+    parse_xml,
+    serialize_xml,
+    _W_T,
 )
-import defusedxml.ElementTree as ET
+from utils.ooxml_fast import may_contain_text, read_document, replace_in_document
+from lxml import etree as ET
+
+DOCUMENT_PART = "word/document.xml"
+SETTINGS_PART = "word/settings.xml"
 
 
 def replace_text(
@@ -58,17 +79,93 @@ def replace_text(
     Returns:
         Number of replacements made
     """
+    if not find_text:
+        raise ValueError("Find text must not be empty")
+
+    # Untracked edits can skip the XML round-trip. Quotes may be serialized
+    # raw or as entities, so those finds always take the tree path.
+    if not track_changes and '"' not in find_text and "'" not in find_text:
+        count = replace_in_document(folder_path, find_text, replace_text)
+        if count is not None:
+            return count
+
+    return replace_many(folder_path, [(find_text, replace_text)], track_changes, author)
+
+
+def replace_many(
+    folder_path: str,
+    pairs: list[tuple[str, str]],
+    track_changes: bool = False,
+    author: str = "Document Editor",
+) -> int:
+    """
+    Find and replace several strings in a single pass over the document.
+
+    Args:
+        folder_path: Path to unpacked DOCX folder
+        pairs: List of (find_text, replace_text) tuples
+        track_changes: Whether to use tracked changes
+        author: Author name for tracked changes
+
+    Returns:
+        Number of replacements made
+    """
+    # Skip the parse entirely when none of the find strings are present
+    raw = read_document(folder_path)
+    if not any(may_contain_text(raw, find) for find, _ in pairs):
+        return 0
+
+    change_id = get_next_change_id_from_bytes(raw) if track_changes else 0
     root = parse_document(folder_path)
-    replacements = 0
-    change_id = get_next_change_id(root) if track_changes else 0
 
     if track_changes:
         enable_track_changes(folder_path)
 
+    replacements, _ = _apply_replacements(
+        root, pairs, track_changes, author, change_id
+    )
+
+    save_document(root, folder_path)
+    return replacements
+
+
+def _apply_replacements(
+    root: ET._Element,
+    pairs: list[tuple[str, str]],
+    track_changes: bool,
+    author: str,
+    change_id: int,
+) -> tuple[int, int]:
+    """
+    Apply find/replace pairs to a parsed document tree.
+
+    Args:
+        root: Document root element
+        pairs: List of (find_text, replace_text) tuples
+        track_changes: Whether to use tracked changes
+        author: Author name for tracked changes
+        change_id: First change ID to use for tracked changes
+
+    Returns:
+        Tuple of (replacements made, next available change ID)
+    """
+    if any(not find for find, _ in pairs):
+        raise ValueError("Find text must not be empty")
+
+    mapping = dict(pairs)
+    # Longest first so overlapping finds prefer the most specific match
+    pattern = re.compile(
+        "|".join(re.escape(f) for f in sorted(mapping, key=len, reverse=True))
+    )
+
+    replacements = 0
+    # All changes from one edit share a timestamp
+    timestamp = get_timestamp()
+
     for para in find_paragraphs(root):
         para_text = get_text_content(para)
 
-        if find_text not in para_text:
+        if not pattern.search(para_text):
             continue
 
         # Process each run in the paragraph
@@ -76,67 +173,55 @@ def replace_text(
         for run in runs:
             run_text = get_text_content(run)
 
-            if find_text not in run_text:
+            if not pattern.search(run_text):
                 continue
 
-            # Get the parent of the run
-            parent = None
-            for p in para.iter():
-                if run in list(p):
-                    parent = p
-                    break
-
-            if parent is None:
-                parent = para
-
-            # Find the index of this run
-            run_index = list(parent).index(run)
+            # Get the parent of the run and its position
+            parent = run.getparent()
+            run_index = parent.index(run)
 
             if track_changes:
-                # Create deletion for old text
-                del_elem = create_tracked_deletion(find_text, author, change_id)
-                change_id += 1
-
-                # Create insertion for new text
-                ins_elem = create_tracked_insertion(replace_text, author, change_id)
-                change_id += 1
-
-                # Split the run text around the found text
-                before, _, after = run_text.partition(find_text)
-
-                # Remove the original run
-                parent.remove(run)
-
-                # Insert elements in order
-                insert_index = run_index
-                if before:
-                    before_run = create_run(before)
-                    parent.insert(insert_index, before_run)
-                    insert_index += 1
-
-                parent.insert(insert_index, del_elem)
-                insert_index += 1
-
-                parent.insert(insert_index, ins_elem)
-                insert_index += 1
-
-                if after:
-                    after_run = create_run(after)
-                    parent.insert(insert_index, after_run)
+                # Split the run text around every match, in order
+                new_nodes = []
+                pos = 0
+                for match in pattern.finditer(run_text):
+                    found = match.group(0)
+                    if match.start() > pos:
+                        new_nodes.append(create_run(run_text[pos : match.start()]))
+
+                    # Create deletion for old text
+                    new_nodes.append(
+                        create_tracked_deletion(found, author, change_id, date=timestamp)
+                    )
+                    change_id += 1
+
+                    # Create insertion for new text
+                    new_nodes.append(
+                        create_tracked_insertion(
+                            mapping[found], author, change_id, date=timestamp
+                        )
+                    )
+                    change_id += 1
+                    pos = match.end()
+
+                if pos < len(run_text):
+                    new_nodes.append(create_run(run_text[pos:]))
+
+                # Swap the original run for the new nodes in one splice
+                parent[run_index : run_index + 1] = new_nodes
 
             else:
                 # Simple replacement without tracking
-                new_text = run_text.replace(find_text, replace_text)
+                new_text = pattern.sub(lambda m: mapping[m.group(0)], run_text)
 
                 # Update the text element
-                for t in run.iter(f"{{{NAMESPACES['w']}}}t"):
+                for t in run.iter(_W_T):
                     t.text = new_text
                     break
 
             replacements += 1
 
-    save_document(root, folder_path)
-    return replacements
+    return replacements, change_id
 
 
 def insert_text_after(
@@ -159,12 +244,50 @@ def insert_text_after(
     Returns:
         True if insertion was made
     """
+    raw = read_document(folder_path)
+    if not may_contain_text(raw, after_text):
+        return False
+
+    change_id = get_next_change_id_from_bytes(raw) if track_changes else 0
     root = parse_document(folder_path)
-    change_id = get_next_change_id(root) if track_changes else 0
 
     if track_changes:
         enable_track_changes(folder_path)
 
+    inserted, _ = _apply_insert(
+        root, after_text, new_text, track_changes, author, change_id
+    )
+    if not inserted:
+        return False
+
+    save_document(root, folder_path)
+    return True
+
+
+def _apply_insert(
+    root: ET._Element,
+    after_text: str,
+    new_text: str,
+    track_changes: bool,
+    author: str,
+    change_id: int,
+) -> tuple[bool, int]:
+    """
+    Insert text after the first occurrence of a string in a parsed document tree.
+
+    Args:
+        root: Document root element
+        after_text: Text to insert after
+        new_text: Text to insert
+        track_changes: Whether to use tracked changes
+        author: Author name for tracked changes
+        change_id: Change ID to use for a tracked insertion
+
+    Returns:
+        Tuple of (whether insertion was made, next available change ID)
+    """
+    timestamp = get_timestamp()
+
     for para in find_paragraphs(root):
         para_text = get_text_content(para)
 
@@ -178,48 +301,35 @@ def insert_text_after(
                 continue
 
             # Get parent element
-            parent = None
-            for p in para.iter():
-                if run in list(p):
-                    parent = p
-                    break
-
-            if parent is None:
-                parent = para
-
-            run_index = list(parent).index(run)
+            parent = run.getparent()
+            run_index = parent.index(run)
 
             # Split the run text
             before, _, after = run_text.partition(after_text)
             full_before = before + after_text
 
-            # Remove original run
-            parent.remove(run)
-
-            # Insert before text + after_text
-            insert_index = run_index
-            before_run = create_run(full_before)
-            parent.insert(insert_index, before_run)
-            insert_index += 1
+            # Before text + after_text
+            new_nodes = [create_run(full_before)]
 
-            # Insert new text
+            # New text
             if track_changes:
-                ins_elem = create_tracked_insertion(new_text, author, change_id)
-                parent.insert(insert_index, ins_elem)
+                new_nodes.append(
+                    create_tracked_insertion(new_text, author, change_id, date=timestamp)
+                )
+                change_id += 1
             else:
-                new_run = create_run(new_text)
-                parent.insert(insert_index, new_run)
-            insert_index += 1
+                new_nodes.append(create_run(new_text))
 
-            # Insert remaining text
+            # Remaining text
             if after:
-                after_run = create_run(after)
-                parent.insert(insert_index, after_run)
+                new_nodes.append(create_run(after))
+
+            # Swap the original run for the new nodes in one splice
+            parent[run_index : run_index + 1] = new_nodes
 
-            save_document(root, folder_path)
-            return True
+            return True, change_id
 
-    return False
+    return False, change_id
 
 
 def delete_text(
@@ -248,25 +358,208 @@ def delete_text(
         return replace_text(folder_path, text_to_delete, "", False, author)
 
 
+def batch_edit(
+    folder_path: str,
+    ops: list[dict],
+    track_changes: bool = False,
+    author: str = "Document Editor",
+) -> int:
+    """
+    Apply several edits with a single parse and save of the document.
+
+    Each operation is a dict with an "action" key and the same fields as the
+    command line flags:
+        {"action": "replace", "find": "old", "replace": "new"}
+        {"action": "insert", "after": "anchor", "text": "new text"}
+        {"action": "delete", "find": "text to delete"}
+
+    Args:
+        folder_path: Path to unpacked DOCX folder
+        ops: List of edit operations, applied in order
+        track_changes: Whether to use tracked changes
+        author: Author name for tracked changes
+
+    Returns:
+        Total number of edits made
+    """
+    raw = read_document(folder_path)
+    change_id = get_next_change_id_from_bytes(raw) if track_changes else 0
+    root = parse_document(folder_path)
+
+    if track_changes:
+        enable_track_changes(folder_path)
+
+    edits, _ = _apply_ops(root, ops, track_changes, author, change_id)
+
+    save_document(root, folder_path)
+    return edits
+
+
+def _apply_ops(
+    root: ET._Element,
+    ops: list[dict],
+    track_changes: bool,
+    author: str,
+    change_id: int,
+) -> tuple[int, int]:
+    """
+    Apply a list of edit operations to a parsed document tree.
+
+    Args:
+        root: Document root element
+        ops: List of edit operations (see batch_edit)
+        track_changes: Whether to use tracked changes
+        author: Author name for tracked changes
+        change_id: First change ID to use for tracked changes
+
+    Returns:
+        Tuple of (total edits made, next available change ID)
+    """
+    edits = 0
+    for op in ops:
+        action = op.get("action")
+        if action == "replace":
+            count, change_id = _apply_replacements(
+                root, [(op["find"], op["replace"])], track_changes, author, change_id
+            )
+        elif action == "delete":
+            text_to_delete = op.get("find") or op.get("text")
+            count, change_id = _apply_replacements(
+                root, [(text_to_delete, "")], track_changes, author, change_id
+            )
+        elif action == "insert":
+            inserted, change_id = _apply_insert(
+                root, op["after"], op["text"], track_changes, author, change_id
+            )
+            count = int(inserted)
+        else:
+            raise ValueError(f"Unknown action in ops: {action}")
+        edits += count
+
+    return edits, change_id
+
+
+def docx_edit_inplace(
+    src_path: str,
+    dst_path: str,
+    action: str,
+    pairs: list[tuple[str, str]] | None = None,
+    after_text: str | None = None,
+    new_text: str | None = None,
+    ops: list[dict] | None = None,
+    track_changes: bool = False,
+    author: str = "Document Editor",
+) -> int:
+    """
+    Edit a packed .docx in memory, skipping the unpack/pack round-trip.
+
+    Only word/document.xml (and word/settings.xml when tracking changes) are
+    rewritten; every other member is copied across with its original ZipInfo.
+
+    Args:
+        src_path: Path to the input .docx file
+        dst_path: Path for the output .docx file (may equal src_path)
+        action: "replace" (delete is a replace with ""), "insert" or "batch"
+        pairs: List of (find_text, replace_text) tuples (for replace)
+        after_text: Text to insert after (for insert)
+        new_text: Text to insert (for insert)
+        ops: List of edit operations, as for batch_edit (for batch)
+        track_changes: Whether to use tracked changes
+        author: Author name for tracked changes
+
+    Returns:
+        Number of edits made
+    """
+    dst = Path(dst_path)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write next to the destination first so src_path may equal dst_path
+    fd, tmp_path = tempfile.mkstemp(suffix=".docx", dir=dst.parent)
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(src_path, "r") as zin:
+            names = set(zin.namelist())
+            if DOCUMENT_PART not in names:
+                raise FileNotFoundError(f"{DOCUMENT_PART} not found in {src_path}")
+
+            raw = zin.read(DOCUMENT_PART)
+            change_id = get_next_change_id_from_bytes(raw) if track_changes else 0
+            root = parse_xml(raw)
+            if action == "insert":
+                inserted, _ = _apply_insert(
+                    root, after_text, new_text, track_changes, author, change_id
+                )
+                count = int(inserted)
+            elif action == "batch":
+                count, _ = _apply_ops(root, ops, track_changes, author, change_id)
+            else:
+                count, _ = _apply_replacements(
+                    root, pairs, track_changes, author, change_id
+                )
+
+            edited = {DOCUMENT_PART: serialize_xml(root)}
+            if track_changes:
+                settings_xml = zin.read(SETTINGS_PART) if SETTINGS_PART in names else None
+                edited[SETTINGS_PART] = enable_track_changes_xml(settings_xml)
+
+            with zipfile.ZipFile(
+                tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+            ) as zout:
+                # Copied ZipInfos ignore the ZipFile's level, so pass it again
+                for info in zin.infolist():
+                    data = edited.pop(info.filename, None)
+                    zout.writestr(
+                        info,
+                        data if data is not None else zin.read(info),
+                        compresslevel=1,
+                    )
+                # Parts that did not exist in the source (e.g. new settings.xml)
+                for name, data in edited.items():
+                    zout.writestr(name, data)
+
+        # mkstemp creates the file owner-only; keep the source's permissions.
+        # The source is closed by now, which Windows needs to replace it.
+        shutil.copymode(src_path, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    return count
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Edit Word documents with tracked changes support",
         epilog="Example: python docx_edit.py --folder unpacked/ --action replace "
         '--find "old" --replace "new" --track-changes --author "John"',
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--folder",
         "-f",
-        required=True,
         help="Path to unpacked DOCX folder",
     )
+    source.add_argument(
+        "--input",
+        "-i",
+        help="Path to a .docx file to edit in memory without unpacking",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Output .docx path when using --input (default: overwrite input)",
+    )
     parser.add_argument(
         "--action",
         "-a",
-        required=True,
         choices=["replace", "insert", "delete"],
         help="Action to perform",
     )
+    parser.add_argument(
+        "--ops",
+        help="JSON file with a list of edit operations to apply in one pass",
+    )
     parser.add_argument(
         "--find",
         help="Text to find (for replace/delete)",
@@ -275,6 +568,10 @@ def main():
         "--replace",
         help="Replacement text (for replace)",
     )
+    parser.add_argument(
+        "--pairs",
+        help='JSON file of [["find", "replace"], ...] pairs applied in one pass (for replace)',
+    )
     parser.add_argument(
         "--after",
         help="Text to insert after (for insert)",
@@ -297,13 +594,64 @@ def main():
 
     args = parser.parse_args()
 
-    # Validate folder exists
-    if not Path(args.folder).exists():
+    if not args.action and not args.ops:
+        parser.error("--action is required unless --ops is given")
+
+    # Validate folder or input file exists
+    if args.folder and not Path(args.folder).exists():
         print(f"Error: Folder not found: {args.folder}", file=sys.stderr)
         sys.exit(1)
+    if args.input and not Path(args.input).exists():
+        print(f"Error: File not found: {args.input}", file=sys.stderr)
+        sys.exit(1)
+    output = args.output or args.input
 
     try:
-        if args.action == "replace":
+        if args.ops:
+            with open(args.ops) as f:
+                ops = json.load(f)
+
+            if args.input:
+                count = docx_edit_inplace(
+                    args.input,
+                    output,
+                    "batch",
+                    ops=ops,
+                    track_changes=args.track_changes,
+                    author=args.author,
+                )
+            else:
+                count = batch_edit(
+                    args.folder,
+                    ops,
+                    args.track_changes,
+                    args.author,
+                )
+            print(f"Made {count} edit(s)")
+
+        elif args.action == "replace" and args.pairs:
+            with open(args.pairs) as f:
+                pairs = [tuple(pair) for pair in json.load(f)]
+
+            if args.input:
+                count = docx_edit_inplace(
+                    args.input,
+                    output,
+                    "replace",
+                    pairs=pairs,
+                    track_changes=args.track_changes,
+                    author=args.author,
+                )
+            else:
+                count = replace_many(
+                    args.folder,
+                    pairs,
+                    args.track_changes,
+                    args.author,
+                )
+            print(f"Made {count} replacement(s)")
+
+        elif args.action == "replace":
             if not args.find:
                 print("Error: --find is required for replace action", file=sys.stderr)
                 sys.exit(1)
@@ -313,13 +661,23 @@ def main():
                 )
                 sys.exit(1)
 
-            count = replace_text(
-                args.folder,
-                args.find,
-                args.replace,
-                args.track_changes,
-                args.author,
-            )
+            if args.input:
+                count = docx_edit_inplace(
+                    args.input,
+                    output,
+                    "replace",
+                    pairs=[(args.find, args.replace)],
+                    track_changes=args.track_changes,
+                    author=args.author,
+                )
+            else:
+                count = replace_text(
+                    args.folder,
+                    args.find,
+                    args.replace,
+                    args.track_changes,
+                    args.author,
+                )
             print(f"Made {count} replacement(s)")
 
         elif args.action == "insert":
@@ -330,13 +688,24 @@ def main():
                 print("Error: --text is required for insert action", file=sys.stderr)
                 sys.exit(1)
 
-            success = insert_text_after(
-                args.folder,
-                args.after,
-                args.text,
-                args.track_changes,
-                args.author,
-            )
+            if args.input:
+                success = docx_edit_inplace(
+                    args.input,
+                    output,
+                    "insert",
+                    after_text=args.after,
+                    new_text=args.text,
+                    track_changes=args.track_changes,
+                    author=args.author,
+                )
+            else:
+                success = insert_text_after(
+                    args.folder,
+                    args.after,
+                    args.text,
+                    args.track_changes,
+                    args.author,
+                )
             if success:
                 print("Insertion successful")
             else:
@@ -351,12 +720,22 @@ def main():
                 sys.exit(1)
 
             text_to_del = args.find or args.text
-            count = delete_text(
-                args.folder,
-                text_to_del,
-                args.track_changes,
-                args.author,
-            )
+            if args.input:
+                count = docx_edit_inplace(
+                    args.input,
+                    output,
+                    "replace",
+                    pairs=[(text_to_del, "")],
+                    track_changes=args.track_changes,
+                    author=args.author,
+                )
+            else:
+                count = delete_text(
+                    args.folder,
+                    text_to_del,
+                    args.track_changes,
+                    args.author,
+                )
             print(f"Made {count} deletion(s)")
 
     except FileNotFoundError as e:
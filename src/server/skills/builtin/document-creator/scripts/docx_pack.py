@@ -8,7 +8,9 @@ Usage:
 This script repacks an extracted OOXML folder structure back into a valid .docx file.
 """
 
+import os
 import sys
+import json
 import zipfile
 import argparse
 from pathlib import Path
@@ -20,6 +22,44 @@ ROOT_FILES = ["[Content_Types].xml"]
 # Standard DOCX folder structure order (for compatibility)
 FOLDER_ORDER = ["_rels", "docProps", "word"]
 
+# Per-member ZIP metadata written by docx_unpack; never packed itself
+ZIP_META_FILE = ".zipmeta.json"
+
+# Already-compressed media where deflate only burns CPU
+STORED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".wdp", ".mp3", ".mp4", ".m4a"}
+
+
+def _pack_order(arcname: str) -> tuple:
+    """Sort key placing root files first, then FOLDER_ORDER, then the rest."""
+    if arcname in ROOT_FILES:
+        return (0, ROOT_FILES.index(arcname), arcname)
+    top_level = arcname.split("/", 1)[0]
+    if top_level in FOLDER_ORDER:
+        return (1, FOLDER_ORDER.index(top_level), arcname)
+    return (2, 0, arcname)
+
+
+def _load_zip_meta(folder: Path) -> dict:
+    """Load per-member compression and timestamps saved by docx_unpack, if any."""
+    meta_path = folder / ZIP_META_FILE
+    if not meta_path.exists():
+        return {}
+    return json.loads(meta_path.read_text(encoding="utf-8"))
+
+
+def _zip_info(arcname: str, src: Path, meta: dict) -> zipfile.ZipInfo:
+    """Build the ZipInfo for a part, preserving unpacked metadata when known."""
+    info = zipfile.ZipInfo.from_file(src, arcname, strict_timestamps=False)
+    member = meta.get(arcname)
+    if member:
+        info.date_time = tuple(member["date_time"])
+        info.compress_type = member["compress_type"]
+    elif Path(arcname).suffix.lower() in STORED_EXTENSIONS:
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
 
 def pack_docx(folder_path: str, output_path: str) -> str:
     """
@@ -53,33 +93,26 @@ def pack_docx(folder_path: str, output_path: str) -> str:
     # Create output directory if needed
     output.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create the ZIP file with DEFLATED compression
+    # Collect every file in a single walk
+    meta = _load_zip_meta(folder)
+    entries = []
+    for dirpath, _, filenames in os.walk(folder):
+        for filename in filenames:
+            src = Path(dirpath) / filename
+            arcname = src.relative_to(folder).as_posix()
+            if arcname != ZIP_META_FILE:
+                entries.append((arcname, src))
+
+    # [Content_Types].xml first, then folders in order, then anything else
+    entries.sort(key=lambda entry: _pack_order(entry[0]))
+
+    # Keep each member's original compression (media stays STORED); deflate
+    # at level 1 since OOXML parts are small XML where higher levels barely
+    # change the size
     with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as z:
-        # Add files in a specific order for compatibility
-        files_added = set()
-
-        # First, add [Content_Types].xml at root
-        for root_file in ROOT_FILES:
-            file_path = folder / root_file
-            if file_path.exists():
-                z.write(file_path, root_file)
-                files_added.add(file_path)
-
-        # Then add folders in order
-        for folder_name in FOLDER_ORDER:
-            subfolder = folder / folder_name
-            if subfolder.exists():
-                for file_path in subfolder.rglob("*"):
-                    if file_path.is_file() and file_path not in files_added:
-                        arcname = str(file_path.relative_to(folder))
-                        z.write(file_path, arcname)
-                        files_added.add(file_path)
-
-        # Add any remaining files
-        for file_path in folder.rglob("*"):
-            if file_path.is_file() and file_path not in files_added:
-                arcname = str(file_path.relative_to(folder))
-                z.write(file_path, arcname)
+        for arcname, src in entries:
+            info = _zip_info(arcname, src, meta)
+            z.writestr(info, src.read_bytes(), compresslevel=1)
 
     print(f"Created: {output}")
     return str(output)
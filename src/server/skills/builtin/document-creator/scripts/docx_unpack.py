@@ -11,11 +11,17 @@ them to a folder where they can be edited directly.
 """
 
 import sys
+import json
+import shutil
 import zipfile
 import argparse
 from pathlib import Path
 
 
+# Per-member ZIP metadata written alongside the parts, read back by docx_pack
+ZIP_META_FILE = ".zipmeta.json"
+
+
 def unpack_docx(docx_path: str, output_dir: str | None = None) -> str:
     """
     Unpack a .docx file to a folder.
@@ -44,9 +50,28 @@ def unpack_docx(docx_path: str, output_dir: str | None = None) -> str:
     # Create output directory
     out.mkdir(parents=True, exist_ok=True)
 
-    # Extract all files
+    # Extract all files, copying each member with a buffer sized to it
+    out_root = out.resolve()
+    zip_meta = {}
     with zipfile.ZipFile(docx, "r") as z:
-        z.extractall(out)
+        for info in z.infolist():
+            target = out / info.filename
+            if not target.resolve().is_relative_to(out_root):
+                raise ValueError(f"Unsafe path in archive: {info.filename}")
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            buffer_size = max(64 * 1024, min(info.file_size, 1 << 20))
+            with z.open(info) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, length=buffer_size)
+            zip_meta[info.filename] = {
+                "compress_type": info.compress_type,
+                "date_time": info.date_time,
+            }
+
+    # Remember compression and timestamps so repacking can preserve them
+    (out / ZIP_META_FILE).write_text(json.dumps(zip_meta), encoding="utf-8")
 
     print(f"Unpacked to: {out}")
     print(f"  - word/document.xml: Main document content")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Fast byte-level edits for Word document XML.
+
+Operates directly on the serialized document.xml bytes, skipping the XML
+parse and tree walk for edits that only touch text inside <w:t> nodes.
+Callers fall back to the tree-based helpers whenever a match cannot be
+proven to sit entirely within a single text node.
+
+Usage:
+    from utils.ooxml_fast import replace_in_text_nodes
+"""
+
+from pathlib import Path
+
+
+# Escapes lxml and Word apply to text node content; quotes are written raw
+_TEXT_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Printable ASCII that serializers never escape, so it appears verbatim
+_PLAIN_TEXT = frozenset(chr(c) for c in range(0x20, 0x7F)) - frozenset("&<>\"'")
+
+
+def read_document(folder_path: str) -> bytes:
+    """
+    Read the raw document.xml bytes from an unpacked DOCX folder.
+
+    Args:
+        folder_path: Path to unpacked DOCX folder
+
+    Returns:
+        Serialized document.xml
+    """
+    doc_path = Path(folder_path) / "word" / "document.xml"
+    if not doc_path.exists():
+        raise FileNotFoundError(f"document.xml not found in {folder_path}")
+    return doc_path.read_bytes()
+
+
+def _text_is_verbatim(raw: bytes) -> bool:
+    """
+    Check that text in the document can only be spelled one way.
+
+    Args:
+        raw: Serialized document.xml
+
+    Returns:
+        True if every character of text content is serialized as itself
+        (or its standard escape) inside a single text node per run
+    """
+    # UTF-16 parts, numeric character references (&#65;) and CDATA sections
+    # spell text differently, so a byte miss proves nothing there
+    if not raw.startswith((b"<", b"\xef\xbb\xbf")) or b"&#" in raw or b"<![CDATA[" in raw:
+        return False
+    # Run text joins all of its text nodes, so a match could straddle two
+    return raw.count(b"</w:t>") == raw.count(b"</w:t></w:r>")
+
+
+def may_contain_text(raw: bytes, text: str) -> bool:
+    """
+    Cheaply check whether text could occur in any text node.
+
+    Only plain ASCII text free of markup characters has a single possible
+    serialization, and only when each run holds a single text node can the
+    text not be split across nodes; anything else is reported as present.
+
+    Args:
+        raw: Serialized document.xml
+        text: Text to look for
+
+    Returns:
+        False only if the text is certainly absent from the document
+    """
+    if not _PLAIN_TEXT.issuperset(text) or not _text_is_verbatim(raw):
+        return True
+    return text.encode("ascii") in raw
+
+
+def find_match_offsets(raw: bytes, pattern: bytes) -> list[int]:
+    """
+    Find all non-overlapping occurrences of a byte pattern.
+
+    Args:
+        raw: Buffer to scan
+        pattern: Bytes to search for
+
+    Returns:
+        List of match start offsets
+    """
+    if not pattern:
+        raise ValueError("Cannot search for an empty pattern")
+
+    offsets = []
+    step = len(pattern)
+    off = raw.find(pattern)
+    while off != -1:
+        offsets.append(off)
+        off = raw.find(pattern, off + step)
+    return offsets
+
+
+def _text_node_start(raw: bytes, start: int, end: int) -> int:
+    """
+    Locate the <w:t> start tag enclosing the byte span [start, end).
+
+    Args:
+        raw: Serialized document.xml
+        start: Match start offset
+        end: Match end offset
+
+    Returns:
+        Offset of the enclosing <w:t> tag, or -1 if the span is not plain
+        text content of a single w:t element
+    """
+    tag_start = raw.rfind(b"<", 0, start)
+    if not (raw.startswith(b"<w:t>", tag_start) or raw.startswith(b"<w:t ", tag_start)):
+        return -1
+
+    # The match must follow the end of the start tag, not sit in an attribute
+    tag_end = raw.find(b">", tag_start, start)
+    if tag_end == -1 or raw[tag_end - 1 : tag_end] == b"/":
+        return -1
+
+    # Neither end of the match may fall inside an entity reference like &amp;
+    amp = raw.rfind(b"&", tag_end, start)
+    if amp != -1 and raw.find(b";", amp, start) == -1:
+        return -1
+    amp = raw.rfind(b"&", start, end)
+    if amp != -1 and raw.find(b";", amp, end) == -1:
+        return -1
+
+    # And the next tag after the match must close the same text node
+    if raw.find(b"<", end) != raw.find(b"</w:t>", end):
+        return -1
+
+    return tag_start
+
+
+def replace_in_text_nodes(
+    raw: bytes, find_bytes: bytes, replace_bytes: bytes
+) -> tuple[bytes, int] | None:
+    """
+    Replace a byte pattern that only occurs inside <w:t> text nodes.
+
+    Args:
+        raw: Serialized document.xml
+        find_bytes: XML-escaped UTF-8 bytes to find
+        replace_bytes: XML-escaped UTF-8 bytes to replace with
+
+    Returns:
+        Tuple of (new_bytes, text_nodes_changed), or None if there is no
+        match, any match is not plain text content of a w:t element, or some
+        occurrences might be spelled differently and go unmatched
+    """
+    if not _text_is_verbatim(raw):
+        return None
+
+    offsets = find_match_offsets(raw, find_bytes)
+    if not offsets:
+        return None
+
+    text_nodes = set()
+    for off in offsets:
+        node = _text_node_start(raw, off, off + len(find_bytes))
+        if node == -1:
+            return None
+        text_nodes.add(node)
+
+    return raw.replace(find_bytes, replace_bytes), len(text_nodes)
+
+
+def replace_in_document(folder_path: str, find_text: str, replace_text: str) -> int | None:
+    """
+    Replace plain text in document.xml without parsing the XML.
+
+    Args:
+        folder_path: Path to unpacked DOCX folder
+        find_text: Text to find
+        replace_text: Text to replace with
+
+    Returns:
+        Number of text nodes changed, or None if the caller must fall back
+        to the tree-based edit
+    """
+    # Unlike & and <, a > may appear in text unescaped
+    if ">" in find_text:
+        return None
+
+    raw = read_document(folder_path)
+    result = replace_in_text_nodes(
+        raw,
+        find_text.translate(_TEXT_ESCAPE).encode("utf-8"),
+        replace_text.translate(_TEXT_ESCAPE).encode("utf-8"),
+    )
+    if result is None:
+        return None
+
+    new_raw, count = result
+    (Path(folder_path) / "word" / "document.xml").write_bytes(new_raw)
+    return count
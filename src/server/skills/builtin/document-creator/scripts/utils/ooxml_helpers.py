@@ -3,17 +3,18 @@
 OOXML Helper Utilities for Word Document Manipulation.
 
 Provides low-level XML manipulation functions for editing Word documents.
-Uses defusedxml for secure XML parsing.
+Uses lxml with a hardened parser (no entity expansion, no network access).
 
 Usage:
     from utils.ooxml_helpers import parse_document, find_text, create_tracked_insertion
 """
 
+import os
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterator
-import defusedxml.ElementTree as ET
+from lxml import etree as ET
 
 
 # OOXML Namespaces
@@ -27,12 +28,48 @@ NAMESPACES = {
     "w15": "http://schemas.microsoft.com/office/word/2012/wordml",
 }
 
-# Register namespaces for output
-for prefix, uri in NAMESPACES.items():
-    ET.register_namespace(prefix, uri)
-
-
-def parse_document(folder_path: str) -> ET.Element:
+# Clark-notation tag and attribute names, built once at import
+_W = f"{{{NAMESPACES['w']}}}"
+_W_P = f"{_W}p"
+_W_R = f"{_W}r"
+_W_T = f"{_W}t"
+_W_RPR = f"{_W}rPr"
+_W_B = f"{_W}b"
+_W_I = f"{_W}i"
+_W_INS = f"{_W}ins"
+_W_DEL = f"{_W}del"
+_W_DEL_TEXT = f"{_W}delText"
+_W_SETTINGS = f"{_W}settings"
+_W_TRACK_REVISIONS = f"{_W}trackRevisions"
+_W_ID_ATTR = f"{_W}id"
+_W_AUTHOR_ATTR = f"{_W}author"
+_W_DATE_ATTR = f"{_W}date"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Hardened parser: never expand entities, fetch over the network or build huge trees
+_PARSER = ET.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+
+# Folders already known to have track changes enabled in this process
+_tracked_folders: set[str] = set()
+
+# Single-pass translation table for escape_xml_text
+_XML_ESCAPE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&apos;"}
+)
+
+# Over-matching other prefixes only raises the maximum, which is still safe
+_ID_RX = re.compile(rb"w:id\s*=\s*[\"'](\d+)")
+
+# Prefixes bound to the WordprocessingML namespace, usually just w
+_W_PREFIX_RX = re.compile(
+    rb"xmlns:([^\s=]+)\s*=\s*[\"']" + re.escape(NAMESPACES["w"].encode()) + rb"[\"']"
+)
+
+# Any element may carry w:id (bookmarks, comments, revisions...), so collect them all in C
+_ID_XPATH = ET.XPath(".//@w:id", namespaces=NAMESPACES)
+
+
+def parse_document(folder_path: str) -> ET._Element:
     """
     Parse the main document.xml from an unpacked DOCX folder.
 
@@ -46,11 +83,10 @@ def parse_document(folder_path: str) -> ET.Element:
     if not doc_path.exists():
         raise FileNotFoundError(f"document.xml not found in {folder_path}")
 
-    tree = ET.parse(str(doc_path))
-    return tree.getroot()
+    return ET.parse(str(doc_path), _PARSER).getroot()
 
 
-def save_document(root: ET.Element, folder_path: str) -> None:
+def save_document(root: ET._Element, folder_path: str) -> None:
     """
     Save the document.xml back to the unpacked folder.
 
@@ -59,14 +95,43 @@ def save_document(root: ET.Element, folder_path: str) -> None:
         folder_path: Path to unpacked DOCX folder
     """
     doc_path = Path(folder_path) / "word" / "document.xml"
-    tree = ET.ElementTree(root)
 
     # Write with XML declaration
     with open(doc_path, "wb") as f:
-        tree.write(f, encoding="UTF-8", xml_declaration=True)
+        root.getroottree().write(
+            f, encoding="UTF-8", xml_declaration=True, standalone=True
+        )
 
 
-def find_paragraphs(root: ET.Element) -> Iterator[ET.Element]:
+def parse_xml(data: bytes) -> ET._Element:
+    """
+    Parse serialized OOXML part content with the hardened parser.
+
+    Args:
+        data: XML bytes
+
+    Returns:
+        Root element
+    """
+    return ET.fromstring(data, _PARSER)
+
+
+def serialize_xml(root: ET._Element) -> bytes:
+    """
+    Serialize an OOXML part with its XML declaration.
+
+    Args:
+        root: Root element to serialize
+
+    Returns:
+        UTF-8 encoded XML bytes
+    """
+    return ET.tostring(
+        root.getroottree(), encoding="UTF-8", xml_declaration=True, standalone=True
+    )
+
+
+def find_paragraphs(root: ET._Element) -> Iterator[ET._Element]:
     """
     Find all paragraph elements in the document.
 
@@ -76,11 +141,10 @@ def find_paragraphs(root: ET.Element) -> Iterator[ET.Element]:
     Yields:
         Paragraph (w:p) elements
     """
-    for p in root.iter(f"{{{NAMESPACES['w']}}}p"):
-        yield p
+    yield from root.iter(_W_P)
 
 
-def find_runs(paragraph: ET.Element) -> Iterator[ET.Element]:
+def find_runs(paragraph: ET._Element) -> Iterator[ET._Element]:
     """
     Find all run elements in a paragraph.
 
@@ -90,11 +154,10 @@ def find_runs(paragraph: ET.Element) -> Iterator[ET.Element]:
     Yields:
         Run (w:r) elements
     """
-    for r in paragraph.iter(f"{{{NAMESPACES['w']}}}r"):
-        yield r
+    yield from paragraph.iter(_W_R)
 
 
-def get_text_content(element: ET.Element) -> str:
+def get_text_content(element: ET._Element) -> str:
     """
     Extract all text content from an element and its children.
 
@@ -104,14 +167,10 @@ def get_text_content(element: ET.Element) -> str:
     Returns:
         Concatenated text content
     """
-    text_parts = []
-    for t in element.iter(f"{{{NAMESPACES['w']}}}t"):
-        if t.text:
-            text_parts.append(t.text)
-    return "".join(text_parts)
+    return "".join(t.text for t in element.iter(_W_T) if t.text)
 
 
-def find_text(root: ET.Element, search_text: str) -> list[tuple[ET.Element, ET.Element]]:
+def find_text(root: ET._Element, search_text: str) -> list[tuple[ET._Element, ET._Element]]:
     """
     Find all occurrences of text in the document.
 
@@ -140,9 +199,7 @@ def generate_rsid() -> str:
     Returns:
         8-character hexadecimal RSID
     """
-    import random
-
-    return f"{random.randint(0, 0xFFFFFFFF):08X}"
+    return os.urandom(4).hex().upper()
 
 
 def get_timestamp() -> str:
@@ -152,10 +209,10 @@ def get_timestamp() -> str:
     Returns:
         ISO 8601 formatted timestamp
     """
-    return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
 
-def create_text_element(text: str, preserve_space: bool = True) -> ET.Element:
+def create_text_element(text: str, preserve_space: bool = True) -> ET._Element:
     """
     Create a w:t (text) element.
 
@@ -166,14 +223,14 @@ def create_text_element(text: str, preserve_space: bool = True) -> ET.Element:
     Returns:
         w:t element
     """
-    t = ET.Element(f"{{{NAMESPACES['w']}}}t")
+    t = ET.Element(_W_T)
     t.text = text
     if preserve_space and (text.startswith(" ") or text.endswith(" ")):
-        t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+        t.set(_XML_SPACE, "preserve")
     return t
 
 
-def create_run(text: str, bold: bool = False, italic: bool = False) -> ET.Element:
+def create_run(text: str, bold: bool = False, italic: bool = False) -> ET._Element:
     """
     Create a w:r (run) element with text.
 
@@ -185,15 +242,15 @@ def create_run(text: str, bold: bool = False, italic: bool = False) -> ET.Elemen
     Returns:
         w:r element
     """
-    r = ET.Element(f"{{{NAMESPACES['w']}}}r")
+    r = ET.Element(_W_R)
 
     # Add run properties if any formatting
     if bold or italic:
-        rPr = ET.SubElement(r, f"{{{NAMESPACES['w']}}}rPr")
+        rPr = ET.SubElement(r, _W_RPR)
         if bold:
-            ET.SubElement(rPr, f"{{{NAMESPACES['w']}}}b")
+            ET.SubElement(rPr, _W_B)
         if italic:
-            ET.SubElement(rPr, f"{{{NAMESPACES['w']}}}i")
+            ET.SubElement(rPr, _W_I)
 
     # Add text
     t = create_text_element(text)
@@ -208,7 +265,8 @@ def create_tracked_insertion(
     change_id: int,
     bold: bool = False,
     italic: bool = False,
-) -> ET.Element:
+    date: str | None = None,
+) -> ET._Element:
     """
     Create a tracked insertion (w:ins) element.
 
@@ -218,14 +276,15 @@ def create_tracked_insertion(
         change_id: Unique change ID
         bold: Apply bold formatting
         italic: Apply italic formatting
+        date: Change timestamp (default: now)
 
     Returns:
         w:ins element containing the insertion
     """
-    ins = ET.Element(f"{{{NAMESPACES['w']}}}ins")
-    ins.set(f"{{{NAMESPACES['w']}}}id", str(change_id))
-    ins.set(f"{{{NAMESPACES['w']}}}author", author)
-    ins.set(f"{{{NAMESPACES['w']}}}date", get_timestamp())
+    ins = ET.Element(_W_INS)
+    ins.set(_W_ID_ATTR, str(change_id))
+    ins.set(_W_AUTHOR_ATTR, author)
+    ins.set(_W_DATE_ATTR, date or get_timestamp())
 
     # Add the run with text
     r = create_run(text, bold, italic)
@@ -238,7 +297,8 @@ def create_tracked_deletion(
     text: str,
     author: str,
     change_id: int,
-) -> ET.Element:
+    date: str | None = None,
+) -> ET._Element:
     """
     Create a tracked deletion (w:del) element.
 
@@ -246,55 +306,75 @@ def create_tracked_deletion(
         text: Text being deleted
         author: Author name
         change_id: Unique change ID
+        date: Change timestamp (default: now)
 
     Returns:
         w:del element containing the deletion
     """
-    del_elem = ET.Element(f"{{{NAMESPACES['w']}}}del")
-    del_elem.set(f"{{{NAMESPACES['w']}}}id", str(change_id))
-    del_elem.set(f"{{{NAMESPACES['w']}}}author", author)
-    del_elem.set(f"{{{NAMESPACES['w']}}}date", get_timestamp())
+    del_elem = ET.Element(_W_DEL)
+    del_elem.set(_W_ID_ATTR, str(change_id))
+    del_elem.set(_W_AUTHOR_ATTR, author)
+    del_elem.set(_W_DATE_ATTR, date or get_timestamp())
 
     # Create run with deleted text
-    r = ET.Element(f"{{{NAMESPACES['w']}}}r")
-    delText = ET.SubElement(r, f"{{{NAMESPACES['w']}}}delText")
+    r = ET.Element(_W_R)
+    delText = ET.SubElement(r, _W_DEL_TEXT)
     delText.text = text
     if text.startswith(" ") or text.endswith(" "):
-        delText.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+        delText.set(_XML_SPACE, "preserve")
 
     del_elem.append(r)
 
     return del_elem
 
 
-def enable_track_changes(folder_path: str) -> None:
+def enable_track_changes_xml(settings_xml: bytes | None) -> bytes:
     """
-    Enable track changes in the document settings.
+    Enable track changes in serialized settings.xml content.
 
     Args:
-        folder_path: Path to unpacked DOCX folder
-    """
-    settings_path = Path(folder_path) / "word" / "settings.xml"
+        settings_xml: Existing settings.xml bytes, or None if the part is missing
 
-    if not settings_path.exists():
+    Returns:
+        settings.xml bytes with w:trackRevisions present (the input object
+        itself if it was already enabled)
+    """
+    if settings_xml is None:
         # Create minimal settings.xml if it doesn't exist
-        root = ET.Element(f"{{{NAMESPACES['w']}}}settings")
-        root.set(f"xmlns:w", NAMESPACES["w"])
+        root = ET.Element(_W_SETTINGS, nsmap={"w": NAMESPACES["w"]})
+    elif b"<w:trackRevisions" in settings_xml:
+        # Cheap substring peek before paying for a parse and rewrite
+        return settings_xml
     else:
-        tree = ET.parse(str(settings_path))
-        root = tree.getroot()
+        root = parse_xml(settings_xml)
 
     # Check if trackRevisions already exists
-    track_rev = root.find(f".//{{{NAMESPACES['w']}}}trackRevisions")
+    track_rev = root.find(f".//{_W_TRACK_REVISIONS}")
     if track_rev is None:
         # Add trackRevisions element
-        track_rev = ET.Element(f"{{{NAMESPACES['w']}}}trackRevisions")
+        track_rev = ET.Element(_W_TRACK_REVISIONS)
         root.insert(0, track_rev)
 
-    # Save settings
-    tree = ET.ElementTree(root)
-    with open(settings_path, "wb") as f:
-        tree.write(f, encoding="UTF-8", xml_declaration=True)
+    return serialize_xml(root)
+
+
+def enable_track_changes(folder_path: str) -> None:
+    """
+    Enable track changes in the document settings.
+
+    Args:
+        folder_path: Path to unpacked DOCX folder
+    """
+    settings_path = Path(folder_path) / "word" / "settings.xml"
+    key = str(Path(folder_path).resolve())
+    if key in _tracked_folders:
+        return
+
+    settings_xml = settings_path.read_bytes() if settings_path.exists() else None
+    updated = enable_track_changes_xml(settings_xml)
+    if updated is not settings_xml:
+        settings_path.write_bytes(updated)
+    _tracked_folders.add(key)
 
 
 def escape_xml_text(text: str) -> str:
@@ -307,20 +387,10 @@ def escape_xml_text(text: str) -> str:
     Returns:
         Escaped text
     """
-    replacements = [
-        ("&", "&amp;"),
-        ("<", "&lt;"),
-        (">", "&gt;"),
-        ('"', "&quot;"),
-        ("'", "&apos;"),
-    ]
-    result = text
-    for old, new in replacements:
-        result = result.replace(old, new)
-    return result
+    return text.translate(_XML_ESCAPE)
 
 
-def get_next_change_id(root: ET.Element) -> int:
+def get_next_change_id(root: ET._Element) -> int:
     """
     Find the next available change ID for tracked changes.
 
@@ -332,9 +402,8 @@ def get_next_change_id(root: ET.Element) -> int:
     """
     max_id = 0
 
-    # Find all elements with w:id attribute
-    for elem in root.iter():
-        id_attr = elem.get(f"{{{NAMESPACES['w']}}}id")
+    # Find all w:id attribute values
+    for id_attr in _ID_XPATH(root):
         if id_attr:
             try:
                 id_val = int(id_attr)
@@ -343,3 +412,29 @@ def get_next_change_id(root: ET.Element) -> int:
                 pass
 
     return max_id + 1
+
+
+def get_next_change_id_from_bytes(raw: bytes) -> int:
+    """
+    Find the next available change ID from serialized document.xml.
+
+    Scans the raw bytes instead of walking a parsed tree.
+
+    Args:
+        raw: Serialized document.xml
+
+    Returns:
+        Next available change ID
+    """
+    prefixes = set(_W_PREFIX_RX.findall(raw))
+    if not prefixes:
+        # No recognizable namespace declaration to key the scan on
+        return get_next_change_id(parse_xml(raw))
+
+    if prefixes == {b"w"}:
+        id_rx = _ID_RX
+    else:
+        id_rx = re.compile(
+            rb"(?:" + b"|".join(map(re.escape, prefixes)) + rb"):id\s*=\s*[\"'](\d+)"
+        )
+    return max(map(int, id_rx.findall(raw)), default=0) + 1
@@ -6,8 +6,9 @@ Creates and edits .xlsx files using openpyxl with proper formula support,
 formatting, and financial model conventions.
 
 Usage:
-    uvx --with openpyxl python xlsx_create.py --spec spec.json --output report.xlsx
-    uvx --with openpyxl python xlsx_create.py --action add_sheet --input existing.xlsx \
+    uvx --with openpyxl --with lxml python xlsx_create.py --spec spec.json --output report.xlsx
+    uvx --with openpyxl --with lxml --with orjson python xlsx_create.py --spec big.json --output big.xlsx
+    uvx --with openpyxl --with lxml python xlsx_create.py --action add_sheet --input existing.xlsx \
         --spec sheet_spec.json --output updated.xlsx
 
 Actions:
@@ -16,11 +17,20 @@ Actions:
     update      Update cells in existing spreadsheet
 """
 
+import io
 import json
+import os
+import posixpath
+import re
 import sys
 import argparse
+import zipfile
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 try:
     from openpyxl import Workbook, load_workbook
@@ -32,12 +42,38 @@ try:
         Side,
         NamedStyle,
     )
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.cell.cell import ERROR_CODES
+    from openpyxl.compat import safe_string
+    from openpyxl.styles.numbers import BUILTIN_FORMATS_MAX_SIZE
     from openpyxl.utils import get_column_letter
     from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+    from openpyxl.utils.exceptions import CellCoordinatesException
+    from openpyxl.xml import LXML
+    from openpyxl.xml.functions import whitespace
 except ImportError:
     print("Error: openpyxl is required. Run with: uvx --with openpyxl python xlsx_create.py ...", file=sys.stderr)
     sys.exit(1)
 
+# Optional Rust-backed writer for sheets of plain tabular data
+try:
+    from rustpy_xlsxwriter import FastExcel
+except ImportError:
+    FastExcel = None
+
+# Optional faster JSON parser for large specs; its errors subclass json's
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional lxml tree API for patching package XML in place; unlike ElementTree
+# it keeps the original namespace prefixes when writing the XML back out
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
 
 # Financial model color constants (RGB hex without #)
 COLORS = {
@@ -50,16 +86,62 @@ COLORS = {
     "header_text": "FFFFFF", # White - header text
 }
 
+# Formatting keys that determine the style objects built for a range
+STYLE_KEYS = ("bold", "italic", "fontColor", "fontSize", "fontName", "fill", "alignment", "wrap", "border")
+
+# Below this many cells, process startup outweighs building sheets in parallel
+PARALLEL_MIN_CELLS = 100_000
+
+# Worksheet parts and cell style indexes in openpyxl's output
+_SHEET_PART_RE = re.compile(r"xl/worksheets/sheet(\d+)\.xml")
+_CELL_STYLE_RE = re.compile(rb'(<c r="[A-Z]+[0-9]+" s=")([0-9]+)"')
+
+# Package XML names used when patching an existing workbook in place
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_REL_ID = f"{{{_REL_NS}}}id"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_CT_OVERRIDE = "{http://schemas.openxmlformats.org/package/2006/content-types}Override"
+_CONTENT_TYPES = "[Content_Types].xml"
+_WORKSHEET_REL = _REL_NS + "/worksheet"
+_WORKSHEET_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+
+# Workbook elements that precede definedNames in the schema's fixed order
+_BEFORE_DEFINED_NAMES = {_MAIN_NS + name for name in ("sheets", "functionGroups", "externalReferences")}
+
+# Workbook elements that follow calcPr in the schema's fixed order
+_AFTER_CALC_PR = {
+    _MAIN_NS + name
+    for name in (
+        "oleSize", "customWorkbookViews", "pivotCaches", "smartTagPr", "smartTagTypes",
+        "webPublishing", "fileRecoveryPr", "webPublishObjects", "extLst",
+    )
+}
+
 
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color: str) -> str:
     """Convert hex color (with or without #) to ARGB format for openpyxl."""
     color = hex_color.lstrip("#")
     # Ensure 6 characters
     if len(color) == 3:
         color = "".join([c * 2 for c in color])
+    # openpyxl treats 6 characters as ARGB with a transparent alpha; make it opaque
+    if len(color) == 6:
+        color = "FF" + color
     return color.upper()
 
 
+# COLORS in ARGB form, converted once at import
+_COLORS_ARGB = {name: hex_to_rgb(color) for name, color in COLORS.items()}
+
+# Shared style objects; openpyxl styles are immutable so one instance serves every cell
+_FORMULA_FONT = Font(color=_COLORS_ARGB["formula"])
+_THIN_SIDE = Side(style="thin", color=hex_to_rgb("000000"))
+_THIN_BORDER = Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
+
+
+@lru_cache(maxsize=256)
 def parse_cell_range(range_str: str) -> tuple[str, str]:
     """
     Parse a cell range like 'A1:B5' into start and end cells.
@@ -73,22 +155,17 @@ def parse_cell_range(range_str: str) -> tuple[str, str]:
     return range_str.strip(), range_str.strip()
 
 
-def apply_formatting(ws, cell_range: str, formatting: dict[str, Any]) -> None:
+def _build_styles(style_items: Iterable[tuple[str, Any]]) -> tuple:
     """
-    Apply formatting to a range of cells.
+    Build the style objects for a formatting spec.
 
     Args:
-        ws: Worksheet
-        cell_range: Cell range like 'A1:B5' or 'A1'
-        formatting: Dictionary of formatting options
-    """
-    start_cell, end_cell = parse_cell_range(cell_range)
+        style_items: (key, value) pairs of the STYLE_KEYS options that are set
 
-    # Parse coordinates
-    start_col, start_row = coordinate_from_string(start_cell)
-    end_col, end_row = coordinate_from_string(end_cell)
-    start_col_idx = column_index_from_string(start_col)
-    end_col_idx = column_index_from_string(end_col)
+    Returns:
+        Tuple of (font, fill, alignment, border), each None if not set
+    """
+    formatting = dict(style_items)
 
     # Build font
     font_kwargs = {}
@@ -123,18 +200,70 @@ def apply_formatting(ws, cell_range: str, formatting: dict[str, Any]) -> None:
         )
 
     # Build border
-    border = None
-    if formatting.get("border"):
-        side = Side(style="thin", color="000000")
-        border = Border(left=side, right=side, top=side, bottom=side)
+    border = _THIN_BORDER if formatting.get("border") else None
+
+    return font, fill, alignment, border
+
 
-    # Number format
-    number_format = formatting.get("numberFormat")
+# Identical specs share their style objects across ranges
+_cached_build_styles = lru_cache(maxsize=None)(_build_styles)
+
+
+@lru_cache(maxsize=1024)
+def _range_bounds(cell_range: str) -> tuple[int, int, int, int]:
+    """
+    Resolve a cell range like 'A1:B5' or 'A1' to row and column indexes.
+
+    Returns:
+        Tuple of (start_row, end_row, start_col_idx, end_col_idx)
+    """
+    start_cell, end_cell = parse_cell_range(cell_range)
+
+    # Parse coordinates
+    start_col, start_row = coordinate_from_string(start_cell)
+    end_col, end_row = coordinate_from_string(end_cell)
+    return start_row, end_row, column_index_from_string(start_col), column_index_from_string(end_col)
+
+
+def _range_styles(formatting: dict[str, Any]) -> tuple:
+    """
+    Get the style objects and number format for a formatting spec.
+
+    Returns:
+        Tuple of (font, fill, alignment, border, number_format)
+    """
+    style_items = tuple((key, formatting[key]) for key in STYLE_KEYS if key in formatting)
+    try:
+        cache_key = frozenset(style_items)
+    except TypeError:
+        # Unhashable values (e.g. a border given as a dict) can't key the cache
+        styles = _build_styles(style_items)
+    else:
+        styles = _cached_build_styles(cache_key)
+    return styles + (formatting.get("numberFormat"),)
+
+
+def apply_formatting(ws, cell_range: str, formatting: dict[str, Any]) -> None:
+    """
+    Apply formatting to a range of cells.
+
+    Args:
+        ws: Worksheet
+        cell_range: Cell range like 'A1:B5' or 'A1'
+        formatting: Dictionary of formatting options
+    """
+    start_row, end_row, start_col_idx, end_col_idx = _range_bounds(cell_range)
+    font, fill, alignment, border, number_format = _range_styles(formatting)
 
     # Apply to all cells in range
-    for row in range(start_row, end_row + 1):
-        for col in range(start_col_idx, end_col_idx + 1):
-            cell = ws.cell(row=row, column=col)
+    cells = ws.iter_rows(
+        min_row=start_row,
+        max_row=end_row,
+        min_col=start_col_idx,
+        max_col=end_col_idx,
+    )
+    for row in cells:
+        for cell in row:
             if font:
                 cell.font = font
             if fill:
@@ -170,13 +299,18 @@ def create_sheet(ws, sheet_spec: dict[str, Any]) -> None:
         for col_idx, cell_value in enumerate(row_data, start=1):
             cell = ws.cell(row=row_idx, column=col_idx)
 
-            if cell_value is None:
-                continue
-            elif is_formula(cell_value):
-                # Write formula
+            # Dispatch on the exact type first; JSON values are almost always
+            # plain numbers or strings
+            value_type = type(cell_value)
+            if value_type is int or value_type is float:
                 cell.value = cell_value
-                # Apply formula color (black)
-                cell.font = Font(color=COLORS["formula"])
+            elif value_type is str:
+                cell.value = cell_value
+                if cell_value.startswith("="):
+                    # Apply formula color (black)
+                    cell.font = _FORMULA_FONT
+            elif cell_value is None:
+                continue
             elif isinstance(cell_value, (int, float)):
                 cell.value = cell_value
             else:
@@ -206,6 +340,265 @@ def create_sheet(ws, sheet_spec: dict[str, Any]) -> None:
         ws.auto_filter.ref = sheet_spec["autoFilter"]
 
 
+def create_sheet_streaming(ws, sheet_spec: dict[str, Any]) -> None:
+    """
+    Populate a write-only worksheet from a specification.
+
+    Produces the same sheet as create_sheet, but rows are streamed out as they
+    are built so memory stays flat. Sheet-level settings are applied before
+    the first row, and range formatting is resolved per cell while writing.
+
+    Args:
+        ws: Write-only worksheet to populate
+        sheet_spec: Sheet specification dictionary
+    """
+    # Set sheet name if specified
+    if "name" in sheet_spec:
+        ws.title = sheet_spec["name"]
+
+    # Set column widths
+    column_widths = sheet_spec.get("columnWidths", {})
+    for col_letter, width in column_widths.items():
+        ws.column_dimensions[col_letter.upper()].width = width
+
+    # Set row heights
+    row_heights = sheet_spec.get("rowHeights", {})
+    for row_num, height in row_heights.items():
+        ws.row_dimensions[int(row_num)].height = height
+
+    # Freeze panes
+    if "freezePanes" in sheet_spec:
+        ws.freeze_panes = sheet_spec["freezePanes"]
+
+    # Auto-filter
+    if "autoFilter" in sheet_spec:
+        ws.auto_filter.ref = sheet_spec["autoFilter"]
+
+    # Resolve formatting ranges up front, in spec order so later ranges win
+    ranges = [
+        _range_bounds(cell_range) + _range_styles(format_spec)
+        for cell_range, format_spec in sheet_spec.get("formatting", {}).items()
+    ]
+
+    # Formatting and row heights may reach past the last data row
+    data = sheet_spec.get("data", [])
+    last_row = max(
+        [len(data)] + [r[1] for r in ranges] + [int(row_num) for row_num in row_heights],
+    )
+
+    for row_idx in range(1, last_row + 1):
+        row_data = data[row_idx - 1] if row_idx <= len(data) else []
+        row_ranges = [r for r in ranges if r[0] <= row_idx <= r[1]]
+        last_col = max([len(row_data)] + [r[3] for r in row_ranges])
+
+        row = []
+        for col_idx in range(1, last_col + 1):
+            value = row_data[col_idx - 1] if col_idx <= len(row_data) else None
+
+            # Dispatch on the exact type first; JSON values are almost always
+            # plain numbers or strings
+            value_type = type(value)
+            formula = False
+            if value_type is str:
+                formula = value.startswith("=")
+            elif not (
+                value_type is int
+                or value_type is float
+                or value is None
+                or isinstance(value, (int, float))
+            ):
+                value = str(value)
+
+            cell_ranges = [r for r in row_ranges if r[2] <= col_idx <= r[3]] if row_ranges else ()
+            if not cell_ranges and not formula:
+                row.append(value)
+                continue
+
+            cell = WriteOnlyCell(ws, value=value)
+            if formula:
+                # Apply formula color (black)
+                cell.font = _FORMULA_FONT
+            for _, _, _, _, font, fill, alignment, border, number_format in cell_ranges:
+                if font:
+                    cell.font = font
+                if fill:
+                    cell.fill = fill
+                if alignment:
+                    cell.alignment = alignment
+                if border:
+                    cell.border = border
+                if number_format:
+                    cell.number_format = number_format
+            row.append(cell)
+
+        ws.append(row)
+
+
+def is_plain_table(sheet_spec: dict[str, Any]) -> bool:
+    """
+    Check if a sheet is only a header row of unique names over literal values.
+
+    Such sheets have no formulas, formatting or sheet settings, so they can be
+    written by the Rust-backed writer without changing the result.
+    """
+    # The writer takes column names from the records, so it needs at least one
+    if set(sheet_spec) != {"name", "data"} or len(sheet_spec["data"]) < 2:
+        return False
+
+    header = sheet_spec["data"][0]
+    if len(set(header)) != len(header):
+        return False
+    if not all(isinstance(name, str) and name and not is_formula(name) for name in header):
+        return False
+
+    for row_data in sheet_spec["data"][1:]:
+        if len(row_data) > len(header):
+            return False
+        for cell_value in row_data:
+            value_type = type(cell_value)
+            if value_type is str:
+                if cell_value.startswith("="):
+                    return False
+            elif cell_value is not None and value_type is not int and value_type is not float:
+                return False
+    return True
+
+
+def write_plain_tables(sheets: list[dict[str, Any]], output_path: str) -> None:
+    """
+    Write plain tabular sheets with the Rust-backed writer.
+
+    Args:
+        sheets: Sheet specifications that pass is_plain_table
+        output_path: Output file path
+    """
+    writer = FastExcel(output_path, autofit=False)
+    for sheet_spec in sheets:
+        writer.sheet(sheet_spec["name"], _table_records(sheet_spec["data"]))
+    writer.save()
+
+
+def _table_records(data: list[list[Any]]) -> Iterator[dict[str, Any]]:
+    """Yield each data row as a record keyed by the header row."""
+    header = data[0]
+    width = len(header)
+    for row_data in data[1:]:
+        # Every record needs every key, or later values shift left into gaps
+        yield dict(zip(header, row_data + [None] * (width - len(row_data))))
+
+
+def _build_sheet_part(sheet_spec: dict[str, Any]) -> tuple[bytes, tuple]:
+    """
+    Build one sheet in a standalone workbook, in a worker process.
+
+    Args:
+        sheet_spec: Sheet specification dictionary
+
+    Returns:
+        Tuple of (worksheet XML, style tables its style indexes refer to)
+    """
+    wb = Workbook(write_only=True)
+    create_sheet_streaming(wb.create_sheet(), sheet_spec)
+
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    with zipfile.ZipFile(buffer) as z:
+        sheet_xml = z.read("xl/worksheets/sheet1.xml")
+
+    style_tables = (
+        list(wb._cell_styles),
+        list(wb._fonts),
+        list(wb._fills),
+        list(wb._borders),
+        list(wb._number_formats),
+        list(wb._alignments),
+        list(wb._protections),
+    )
+    return sheet_xml, style_tables
+
+
+def _merge_styles(wb, style_tables: tuple) -> dict[int, int]:
+    """
+    Register another workbook's cell styles in wb.
+
+    Args:
+        wb: Workbook to add the styles to
+        style_tables: Style tables returned by _build_sheet_part
+
+    Returns:
+        Dictionary mapping the other workbook's style indexes to wb's
+    """
+    cell_styles, fonts, fills, borders, number_formats, alignments, protections = style_tables
+
+    style_ids = {}
+    for style_id, style in enumerate(cell_styles):
+        merged = copy(style)
+        merged.fontId = wb._fonts.add(fonts[style.fontId])
+        merged.fillId = wb._fills.add(fills[style.fillId])
+        merged.borderId = wb._borders.add(borders[style.borderId])
+        merged.alignmentId = wb._alignments.add(alignments[style.alignmentId])
+        merged.protectionId = wb._protections.add(protections[style.protectionId])
+        if style.numFmtId >= BUILTIN_FORMATS_MAX_SIZE:
+            number_format = number_formats[style.numFmtId - BUILTIN_FORMATS_MAX_SIZE]
+            merged.numFmtId = wb._number_formats.add(number_format) + BUILTIN_FORMATS_MAX_SIZE
+        style_ids[style_id] = wb._cell_styles.add(merged)
+    return style_ids
+
+
+def _build_sheets_parallel(wb, sheets: list[dict[str, Any]]) -> list[bytes]:
+    """
+    Build sheets in worker processes and add them to a write-only workbook.
+
+    Each worker populates its sheet in its own workbook. The workbook here
+    gets the matching empty sheets and the workers' styles, and the returned
+    worksheet XML has its style indexes rewritten to match.
+
+    Args:
+        wb: Write-only workbook to add the sheets to
+        sheets: Sheet specifications
+
+    Returns:
+        Worksheet XML for each sheet, in order
+    """
+    workers = min(len(sheets), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_build_sheet_part, sheets))
+
+    sheet_xml = []
+    for sheet_spec, (xml, style_tables) in zip(sheets, parts):
+        # The name and filter range are all the workbook part records
+        ws = wb.create_sheet()
+        create_sheet_streaming(
+            ws, {key: sheet_spec[key] for key in ("name", "autoFilter") if key in sheet_spec}
+        )
+
+        style_ids = _merge_styles(wb, style_tables)
+        if any(old != new for old, new in style_ids.items()):
+            xml = _CELL_STYLE_RE.sub(
+                lambda m: b"%s%d\"" % (m.group(1), style_ids[int(m.group(2))]),
+                xml,
+            )
+        sheet_xml.append(xml)
+    return sheet_xml
+
+
+def _save_with_sheet_parts(wb, sheet_xml: list[bytes], output_path: str) -> None:
+    """
+    Save a workbook, replacing its worksheet parts with prebuilt XML.
+
+    Args:
+        wb: Workbook whose sheets are placeholders for sheet_xml
+        sheet_xml: Worksheet XML for each sheet, in order
+        output_path: Output file path
+    """
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    with zipfile.ZipFile(buffer) as src, zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            match = _SHEET_PART_RE.fullmatch(info.filename)
+            dst.writestr(info, sheet_xml[int(match.group(1)) - 1] if match else src.read(info))
+
+
 def create_workbook(spec: dict[str, Any], output_path: str) -> None:
     """
     Create a new workbook from a specification.
@@ -214,22 +607,41 @@ def create_workbook(spec: dict[str, Any], output_path: str) -> None:
         spec: Workbook specification
         output_path: Output file path
     """
-    wb = Workbook()
-
-    # Remove default sheet if we're creating our own
     sheets = spec.get("sheets", [])
+    if (
+        FastExcel is not None
+        and sheets
+        and not spec.get("properties")
+        and all(is_plain_table(sheet_spec) for sheet_spec in sheets)
+        and len({sheet_spec["name"] for sheet_spec in sheets}) == len(sheets)
+    ):
+        write_plain_tables(sheets, output_path)
+        print(f"Created: {output_path}")
+        return
+
+    sheet_xml = None
     if sheets:
-        # Use the first sheet as the default
-        default_sheet = wb.active
-        create_sheet(default_sheet, sheets[0])
-
-        # Create additional sheets
-        for sheet_spec in sheets[1:]:
-            ws = wb.create_sheet()
-            create_sheet(ws, sheet_spec)
+        # Stream every sheet through a write-only workbook
+        wb = Workbook(write_only=True)
+        total_cells = sum(len(row_data) for sheet_spec in sheets for row_data in sheet_spec.get("data", []))
+        if not LXML and total_cells >= PARALLEL_MIN_CELLS:
+            # openpyxl only streams write-only sheets through lxml's incremental writer
+            print("Warning: lxml not installed, large workbooks save about 2x slower. "
+                  "Run with: uvx --with openpyxl --with lxml python xlsx_create.py ...", file=sys.stderr)
+        if len(sheets) > 1 and total_cells >= PARALLEL_MIN_CELLS and (os.cpu_count() or 1) > 1:
+            try:
+                sheet_xml = _build_sheets_parallel(wb, sheets)
+            except (AttributeError, KeyError, IndexError, TypeError):
+                # Merging styles reads openpyxl internals; if those changed,
+                # start over and build the sheets one at a time
+                wb = Workbook(write_only=True)
+        if sheet_xml is None:
+            for sheet_spec in sheets:
+                ws = wb.create_sheet()
+                create_sheet_streaming(ws, sheet_spec)
     else:
         # No sheets specified, create an empty workbook
-        pass
+        wb = Workbook()
 
     # Set workbook properties
     properties = spec.get("properties", {})
@@ -239,10 +651,277 @@ def create_workbook(spec: dict[str, Any], output_path: str) -> None:
         wb.properties.creator = properties["creator"]
 
     # Save
-    wb.save(output_path)
+    if sheet_xml is not None:
+        _save_with_sheet_parts(wb, sheet_xml, output_path)
+    else:
+        wb.save(output_path)
     print(f"Created: {output_path}")
 
 
+def _related_parts(z: zipfile.ZipFile, part: str, rel_type: str) -> dict[str, str]:
+    """
+    Resolve a part's relationships of one type to package paths.
+
+    Args:
+        z: Open .xlsx package
+        part: Source part path, or "" for the package itself
+        rel_type: Suffix of the relationship type URI, like "/worksheet"
+
+    Returns:
+        Dictionary of {relationship_id: part_path}
+    """
+    folder, name = posixpath.split(part)
+    rels = etree.fromstring(z.read(posixpath.join(folder, "_rels", name + ".rels")))
+
+    targets = {}
+    for rel in rels.iter(_PKG_REL):
+        if not rel.get("Type", "").endswith(rel_type) or rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target")
+        if target.startswith("/"):
+            targets[rel.get("Id")] = target[1:]
+        else:
+            targets[rel.get("Id")] = posixpath.normpath(posixpath.join(folder, target))
+    return targets
+
+
+def _xml_bytes(root) -> bytes:
+    """Serialize a package part's XML with its declaration."""
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _write_package(
+    src: zipfile.ZipFile,
+    parts: dict[str, bytes],
+    output_path: str,
+    dropped: frozenset[str] = frozenset(),
+) -> None:
+    """
+    Copy a package, replacing or adding the given parts.
+
+    Args:
+        src: Open source package
+        parts: Dictionary of {part_path: content}; paths not in src are added
+        output_path: Output file path
+        dropped: Part paths to leave out
+    """
+    # Build in memory first, since the output may overwrite the input
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            if info.filename not in dropped:
+                dst.writestr(info, parts.get(info.filename) or src.read(info))
+        existing = set(src.namelist())
+        for part, content in parts.items():
+            if part not in existing:
+                dst.writestr(part, content)
+
+    Path(output_path).write_bytes(buffer.getbuffer())
+
+
+def _patch_workbook_xml(root) -> None:
+    """Ask spreadsheet applications to recalculate every formula on open."""
+    calc_pr = root.find(_MAIN_NS + "calcPr")
+    if calc_pr is None:
+        calc_pr = etree.Element(_MAIN_NS + "calcPr")
+        following = next((child for child in root if child.tag in _AFTER_CALC_PR), None)
+        if following is not None:
+            following.addprevious(calc_pr)
+        else:
+            root.append(calc_pr)
+    calc_pr.set("fullCalcOnLoad", "1")
+
+
+def _merge_style_list(target, source) -> list[int]:
+    """
+    Append the records of a styles.xml list to the same list in another stylesheet.
+
+    Records identical to one already in the target are reused.
+
+    Args:
+        target: List element to add to, like <fonts>
+        source: Matching list element of the other stylesheet
+
+    Returns:
+        Index in target of each record in source
+    """
+    existing = {etree.tostring(child, with_tail=False): idx for idx, child in enumerate(target)}
+    ids = []
+    for child in list(source):
+        key = etree.tostring(child, with_tail=False)
+        if key not in existing:
+            existing[key] = len(target)
+            target.append(child)
+        ids.append(existing[key])
+    target.set("count", str(len(target)))
+    return ids
+
+
+def _merge_stylesheet(target, source) -> list[int]:
+    """
+    Add the cell formats of one styles.xml to another.
+
+    Args:
+        target: Root of the stylesheet to add to
+        source: Root of the stylesheet the new cells use
+
+    Returns:
+        Index in target's cellXfs of each of source's cellXfs
+    """
+    record_ids = {}
+    for name, attr in (("fonts", "fontId"), ("fills", "fillId"), ("borders", "borderId")):
+        target_list = target.find(_MAIN_NS + name)
+        if target_list is None:
+            raise ValueError(f"Stylesheet without {name}")
+        record_ids[attr] = _merge_style_list(target_list, source.find(_MAIN_NS + name))
+
+    # Custom number formats are matched by format code and renumbered past the target's
+    num_fmts = target.find(_MAIN_NS + "numFmts")
+    format_ids = {} if num_fmts is None else {
+        num_fmt.get("formatCode"): int(num_fmt.get("numFmtId"))
+        for num_fmt in num_fmts.iter(_MAIN_NS + "numFmt")
+    }
+    next_id = max([BUILTIN_FORMATS_MAX_SIZE - 1, *format_ids.values()]) + 1
+    num_fmt_ids = {}
+    for num_fmt in source.iterfind(f"{_MAIN_NS}numFmts/{_MAIN_NS}numFmt"):
+        code = num_fmt.get("formatCode")
+        if code not in format_ids:
+            if num_fmts is None:
+                num_fmts = etree.Element(_MAIN_NS + "numFmts")
+                target.insert(0, num_fmts)
+            etree.SubElement(num_fmts, _MAIN_NS + "numFmt", numFmtId=str(next_id), formatCode=code)
+            format_ids[code] = next_id
+            next_id += 1
+        num_fmt_ids[num_fmt.get("numFmtId")] = str(format_ids[code])
+    if num_fmts is not None:
+        num_fmts.set("count", str(len(num_fmts)))
+
+    cell_xfs = source.find(_MAIN_NS + "cellXfs")
+    for xf in cell_xfs:
+        for attr, ids in record_ids.items():
+            xf.set(attr, str(ids[int(xf.get(attr, "0"))]))
+        number_format = xf.get("numFmtId", "0")
+        xf.set("numFmtId", num_fmt_ids.get(number_format, number_format))
+
+    target_xfs = target.find(_MAIN_NS + "cellXfs")
+    if target_xfs is None:
+        raise ValueError("Stylesheet without cellXfs")
+    return _merge_style_list(target_xfs, cell_xfs)
+
+
+def _unique_sheet_name(sheet_name: str, sheet_names: list[str]) -> str:
+    """Suffix a sheet name with _1, _2, ... until it is not in sheet_names."""
+    if sheet_name not in sheet_names:
+        return sheet_name
+    base_name = sheet_name
+    counter = 1
+    while sheet_name in sheet_names:
+        sheet_name = f"{base_name}_{counter}"
+        counter += 1
+    return sheet_name
+
+
+def _splice_sheet(input_path: str, sheet_spec: dict[str, Any], output_path: str) -> str:
+    """
+    Add a sheet by inserting its worksheet part into the existing package.
+
+    The sheet is built on its own in a write-only workbook. Its part, cell
+    formats and defined names are then merged into a copy of the input, so
+    the existing sheets are never parsed or re-serialized.
+
+    Args:
+        input_path: Path to existing workbook
+        sheet_spec: Sheet specification
+        output_path: Output file path
+
+    Returns:
+        Name of the added sheet
+    """
+    with zipfile.ZipFile(input_path) as src:
+        (workbook,) = _related_parts(src, "", "/officeDocument").values()
+        (styles,) = _related_parts(src, workbook, "/styles").values()
+        workbook_root = etree.fromstring(src.read(workbook))
+        sheets = workbook_root.find(_MAIN_NS + "sheets")
+        sheet_names = [sheet.get("name") for sheet in sheets.iter(_MAIN_NS + "sheet")]
+
+        sheet_name = _unique_sheet_name(sheet_spec.get("name", "Sheet"), sheet_names)
+        if sheet_name != sheet_spec.get("name", "Sheet"):
+            sheet_spec["name"] = sheet_name
+
+        wb = Workbook(write_only=True)
+        create_sheet_streaming(wb.create_sheet(title=sheet_name), sheet_spec)
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        with zipfile.ZipFile(buffer) as built:
+            if "xl/worksheets/_rels/sheet1.xml.rels" in built.namelist():
+                raise ValueError("New sheet has relationships of its own")
+            sheet_xml = built.read("xl/worksheets/sheet1.xml")
+            built_styles = etree.fromstring(built.read("xl/styles.xml"))
+            built_names = etree.fromstring(built.read("xl/workbook.xml")).findall(
+                f"{_MAIN_NS}definedNames/{_MAIN_NS}definedName"
+            )
+
+        styles_root = etree.fromstring(src.read(styles))
+        style_ids = _merge_stylesheet(styles_root, built_styles)
+        sheet_xml = _CELL_STYLE_RE.sub(
+            lambda m: b"%s%d\"" % (m.group(1), style_ids[int(m.group(2))]),
+            sheet_xml,
+        )
+
+        # Next free worksheet part name and relationship id
+        folder, name = posixpath.split(workbook)
+        existing = set(src.namelist())
+        part_number = 1
+        while posixpath.join(folder, "worksheets", f"sheet{part_number}.xml") in existing:
+            part_number += 1
+        part = posixpath.join(folder, "worksheets", f"sheet{part_number}.xml")
+
+        rels_part = posixpath.join(folder, "_rels", name + ".rels")
+        rels = etree.fromstring(src.read(rels_part))
+        rel_ids = {rel.get("Id") for rel in rels.iter(_PKG_REL)}
+        rel_number = 1
+        while f"rId{rel_number}" in rel_ids:
+            rel_number += 1
+        rel_id = f"rId{rel_number}"
+        etree.SubElement(
+            rels, _PKG_REL, Id=rel_id, Type=_WORKSHEET_REL, Target=posixpath.relpath(part, folder or ".")
+        )
+
+        sheet_id = max((int(sheet.get("sheetId")) for sheet in sheets.iter(_MAIN_NS + "sheet")), default=0) + 1
+        sheet = etree.SubElement(sheets, _MAIN_NS + "sheet", nsmap={"r": _REL_NS})
+        sheet.set("name", sheet_name)
+        sheet.set("sheetId", str(sheet_id))
+        sheet.set(_REL_ID, rel_id)
+
+        # Filter ranges and other sheet-scoped names point at the new sheet's index
+        if built_names:
+            defined_names = workbook_root.find(_MAIN_NS + "definedNames")
+            if defined_names is None:
+                defined_names = etree.Element(_MAIN_NS + "definedNames")
+                anchor = [child for child in workbook_root if child.tag in _BEFORE_DEFINED_NAMES][-1]
+                anchor.addnext(defined_names)
+            for defined_name in built_names:
+                defined_name.set("localSheetId", str(len(sheet_names)))
+                defined_names.append(defined_name)
+        _patch_workbook_xml(workbook_root)
+
+        types = etree.fromstring(src.read(_CONTENT_TYPES))
+        etree.SubElement(types, _CT_OVERRIDE, PartName="/" + part, ContentType=_WORKSHEET_TYPE)
+
+        _write_package(
+            src,
+            {
+                workbook: _xml_bytes(workbook_root),
+                rels_part: _xml_bytes(rels),
+                styles: _xml_bytes(styles_root),
+                _CONTENT_TYPES: _xml_bytes(types),
+                part: sheet_xml,
+            },
+            output_path,
+        )
+    return sheet_name
+
+
 def add_sheet_to_workbook(
     input_path: str,
     sheet_spec: dict[str, Any],
@@ -256,18 +935,20 @@ def add_sheet_to_workbook(
         sheet_spec: Sheet specification
         output_path: Output file path
     """
-    wb = load_workbook(input_path)
+    if etree is not None:
+        try:
+            sheet_name = _splice_sheet(input_path, sheet_spec, output_path)
+        except (KeyError, ValueError, TypeError, zipfile.BadZipFile, etree.XMLSyntaxError):
+            pass  # Unusual package layout; let openpyxl handle it
+        else:
+            print(f"Added sheet '{sheet_name}' to: {output_path}")
+            return
 
-    # Create new sheet
-    sheet_name = sheet_spec.get("name", "Sheet")
+    wb = load_workbook(input_path)
 
-    # Handle duplicate names
-    if sheet_name in wb.sheetnames:
-        base_name = sheet_name
-        counter = 1
-        while sheet_name in wb.sheetnames:
-            sheet_name = f"{base_name}_{counter}"
-            counter += 1
+    # Create new sheet, handling duplicate names
+    sheet_name = _unique_sheet_name(sheet_spec.get("name", "Sheet"), wb.sheetnames)
+    if sheet_name != sheet_spec.get("name", "Sheet"):
         sheet_spec["name"] = sheet_name
 
     ws = wb.create_sheet(title=sheet_name)
@@ -277,6 +958,194 @@ def add_sheet_to_workbook(
     print(f"Added sheet '{sheet_name}' to: {output_path}")
 
 
+def _cell_index(cell_ref: str) -> tuple[int, int]:
+    """Resolve a single cell reference like 'A1' to (row, col_idx)."""
+    col, row = coordinate_from_string(cell_ref)
+    return row, column_index_from_string(col)
+
+
+def _set_cell_value(cell, value: Any) -> None:
+    """
+    Replace a <c> element's value, keeping its style, the way openpyxl writes it.
+
+    Args:
+        cell: Cell element to rewrite
+        value: New value from the spec
+    """
+    formula = cell.find(_MAIN_NS + "f")
+    if formula is not None and formula.get("ref") is not None:
+        # Other cells share or spill from this formula
+        raise ValueError(f"Cell {cell.get('r')} anchors a shared or array formula")
+
+    for child in list(cell):
+        cell.remove(child)
+    for attr in ("t", "cm", "vm"):
+        cell.attrib.pop(attr, None)
+
+    if value is None or value == "":
+        return
+    if type(value) is str:
+        value = value[:32767]
+        if len(value) > 1 and value.startswith("="):
+            etree.SubElement(cell, _MAIN_NS + "f").text = value[1:]
+        elif value in ERROR_CODES:
+            cell.set("t", "e")
+            etree.SubElement(cell, _MAIN_NS + "v").text = value
+        else:
+            cell.set("t", "inlineStr")
+            text = etree.SubElement(etree.SubElement(cell, _MAIN_NS + "is"), _MAIN_NS + "t")
+            text.text = value
+            whitespace(text)
+    elif type(value) is bool:
+        cell.set("t", "b")
+        etree.SubElement(cell, _MAIN_NS + "v").text = safe_string(value)
+    elif type(value) is int or type(value) is float:
+        etree.SubElement(cell, _MAIN_NS + "v").text = safe_string(value)
+    else:
+        raise TypeError(f"Cannot convert {value!r} to Excel")
+
+
+def _patch_sheet(root, cells: dict[str, Any]) -> None:
+    """
+    Write cell values into a parsed worksheet, creating rows and cells as needed.
+
+    Args:
+        root: Worksheet root element
+        cells: Dictionary of {cell_ref: value, ...}
+    """
+    sheet_data = root.find(_MAIN_NS + "sheetData")
+    if sheet_data is None:
+        raise ValueError("Worksheet without sheetData")
+
+    merged = [
+        _range_bounds(merge.get("ref"))
+        for merge in root.iterfind(f"{_MAIN_NS}mergeCells/{_MAIN_NS}mergeCell")
+    ]
+
+    # Group updates by row; a later duplicate of a cell wins, as with ws[ref] = value
+    by_row: dict[int, dict[int, Any]] = {}
+    for cell_ref, value in cells.items():
+        row_idx, col_idx = _cell_index(cell_ref)
+        for start_row, end_row, start_col, end_col in merged:
+            if start_row <= row_idx <= end_row and start_col <= col_idx <= end_col:
+                if (row_idx, col_idx) != (start_row, start_col):
+                    raise ValueError(f"Cell {cell_ref} is inside a merged range")
+        by_row.setdefault(row_idx, {})[col_idx] = value
+
+    rows = sheet_data.findall(_MAIN_NS + "row")
+    row_numbers = [int(row.get("r")) for row in rows]
+    if row_numbers != sorted(row_numbers):
+        raise ValueError("Worksheet rows out of order")
+
+    for row_idx, row_cells in by_row.items():
+        pos = bisect_left(row_numbers, row_idx)
+        if pos < len(rows) and row_numbers[pos] == row_idx:
+            row = rows[pos]
+            # The spans hint may no longer cover the row's cells
+            row.attrib.pop("spans", None)
+        else:
+            row = etree.Element(_MAIN_NS + "row", r=str(row_idx))
+            if pos < len(rows):
+                rows[pos].addprevious(row)
+            else:
+                sheet_data.append(row)
+            rows.insert(pos, row)
+            row_numbers.insert(pos, row_idx)
+
+        row_cells_xml = row.findall(_MAIN_NS + "c")
+        col_numbers = [_cell_index(cell.get("r"))[1] for cell in row_cells_xml]
+        if col_numbers != sorted(col_numbers):
+            raise ValueError(f"Cells out of order in row {row_idx}")
+
+        for col_idx, value in row_cells.items():
+            pos = bisect_left(col_numbers, col_idx)
+            if pos < len(row_cells_xml) and col_numbers[pos] == col_idx:
+                cell = row_cells_xml[pos]
+            else:
+                cell = etree.Element(_MAIN_NS + "c", r=f"{get_column_letter(col_idx)}{row_idx}")
+                if pos < len(row_cells_xml):
+                    row_cells_xml[pos].addprevious(cell)
+                else:
+                    row.append(cell)
+                row_cells_xml.insert(pos, cell)
+                col_numbers.insert(pos, col_idx)
+            _set_cell_value(cell, value)
+
+    # Grow the stored used range to take in any new cells
+    dimension = root.find(_MAIN_NS + "dimension")
+    if dimension is not None and rows:
+        min_row, max_row, min_col, max_col = _range_bounds(dimension.get("ref"))
+        min_row = min(min_row, row_numbers[0])
+        max_row = max(max_row, row_numbers[-1])
+        for row_cells in by_row.values():
+            min_col = min(min_col, *row_cells)
+            max_col = max(max_col, *row_cells)
+        dimension.set(
+            "ref",
+            f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}",
+        )
+
+
+def _patch_cells(input_path: str, updates: dict[str, Any], output_path: str) -> list[str]:
+    """
+    Update cells by rewriting only the affected worksheet parts.
+
+    Every other part is copied over unchanged. Cached formula results in
+    untouched cells may now be stale, so the workbook is flagged for a full
+    recalculation on open and its calculation chain is dropped.
+
+    Args:
+        input_path: Path to existing workbook
+        updates: Dictionary of {sheet_name: {cell_ref: value, ...}, ...}
+        output_path: Output file path
+
+    Returns:
+        Names of sheets in updates that the workbook does not have
+    """
+    with zipfile.ZipFile(input_path) as src:
+        (workbook,) = _related_parts(src, "", "/officeDocument").values()
+        worksheets = _related_parts(src, workbook, "/worksheet")
+        workbook_root = etree.fromstring(src.read(workbook))
+        sheet_ids = {
+            sheet.get("name"): sheet.get(_REL_ID)
+            for sheet in workbook_root.iter(_MAIN_NS + "sheet")
+        }
+
+        patched = {}
+        missing = []
+        for sheet_name, cells in updates.items():
+            if sheet_name not in sheet_ids:
+                missing.append(sheet_name)
+                continue
+            part = worksheets[sheet_ids[sheet_name]]
+            root = etree.fromstring(patched.get(part) or src.read(part))
+            _patch_sheet(root, cells)
+            patched[part] = _xml_bytes(root)
+
+        _patch_workbook_xml(workbook_root)
+        patched[workbook] = _xml_bytes(workbook_root)
+
+        # Drop the calculation chain; it may list cells that no longer hold formulas
+        dropped = frozenset(_related_parts(src, workbook, "/calcChain").values())
+        if dropped:
+            folder, name = posixpath.split(workbook)
+            rels_part = posixpath.join(folder, "_rels", name + ".rels")
+            rels = etree.fromstring(src.read(rels_part))
+            for rel in list(rels.iter(_PKG_REL)):
+                if rel.get("Type", "").endswith("/calcChain"):
+                    rels.remove(rel)
+            patched[rels_part] = _xml_bytes(rels)
+
+            types = etree.fromstring(src.read(_CONTENT_TYPES))
+            for override in list(types.iter(_CT_OVERRIDE)):
+                if override.get("PartName", "").lstrip("/") in dropped:
+                    types.remove(override)
+            patched[_CONTENT_TYPES] = _xml_bytes(types)
+
+        _write_package(src, patched, output_path, dropped)
+    return missing
+
+
 def update_cells(
     input_path: str,
     updates: dict[str, Any],
@@ -290,6 +1159,17 @@ def update_cells(
         updates: Dictionary of {sheet_name: {cell_ref: value, ...}, ...}
         output_path: Output file path
     """
+    if etree is not None:
+        try:
+            missing = _patch_cells(input_path, updates, output_path)
+        except (KeyError, ValueError, TypeError, CellCoordinatesException, zipfile.BadZipFile, etree.XMLSyntaxError):
+            pass  # Unusual package or value; let openpyxl handle it
+        else:
+            for sheet_name in missing:
+                print(f"Warning: Sheet '{sheet_name}' not found", file=sys.stderr)
+            print(f"Updated: {output_path}")
+            return
+
     wb = load_workbook(input_path)
 
     for sheet_name, cells in updates.items():
@@ -298,8 +1178,10 @@ def update_cells(
             continue
 
         ws = wb[sheet_name]
+        # ws.cell skips the range parsing that ws[cell_ref] does for every key
         for cell_ref, value in cells.items():
-            ws[cell_ref] = value
+            row_idx, col_idx = _cell_index(cell_ref)
+            ws.cell(row=row_idx, column=col_idx).value = value
 
     wb.save(output_path)
     print(f"Updated: {output_path}")
@@ -343,19 +1225,19 @@ def main():
 
     # Read specification
     if args.stdin:
-        spec_json = sys.stdin.read()
+        spec_json = sys.stdin.buffer.read()
     elif args.spec:
         if not Path(args.spec).exists():
             print(f"Error: Spec file not found: {args.spec}", file=sys.stderr)
             sys.exit(1)
-        with open(args.spec) as f:
+        with open(args.spec, "rb") as f:
             spec_json = f.read()
     else:
         print("Error: Either --spec or --stdin is required", file=sys.stderr)
         sys.exit(1)
 
     try:
-        spec = json.loads(spec_json)
+        spec = json_loads(spec_json)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON: {e}", file=sys.stderr)
         sys.exit(1)
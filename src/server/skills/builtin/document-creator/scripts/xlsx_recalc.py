@@ -20,18 +20,36 @@ without recalculating formulas.
 import json
 import os
 import platform
+import posixpath
+import re
 import shutil
+import signal
+import socket
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from multiprocessing import Pool
 from pathlib import Path
 
 try:
     from openpyxl import load_workbook
+    from openpyxl.utils import get_column_letter
 except ImportError:
     print("Error: openpyxl is required. Run with: uvx --with openpyxl python xlsx_recalc.py ...", file=sys.stderr)
     sys.exit(1)
 
+# LibreOffice's Python bridge, for recalculating many files in one process
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+except ImportError:
+    uno = None
+
 
 # Excel error values to detect
 EXCEL_ERRORS = [
@@ -47,42 +65,95 @@ EXCEL_ERRORS = [
     "#CALC!",
 ]
 
-
+# Single pass over a cell value for any error; EXCEL_ERRORS order breaks ties
+_ERROR_RE = re.compile("|".join(re.escape(err) for err in EXCEL_ERRORS))
+_ERROR_RANK = {err: rank for rank, err in enumerate(EXCEL_ERRORS)}
+
+# Locations reported per error type; further hits are only counted
+MAX_ERROR_LOCATIONS = 20
+
+# SpreadsheetML names used when scanning the package XML directly
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_SHEET = _MAIN_NS + "sheet"
+_ROW = _MAIN_NS + "row"
+_C = _MAIN_NS + "c"
+_F = _MAIN_NS + "f"
+_V = _MAIN_NS + "v"
+_IS = _MAIN_NS + "is"
+_SI = _MAIN_NS + "si"
+_T = _MAIN_NS + "t"
+_R_T = f"{_MAIN_NS}r/{_MAIN_NS}t"
+
+
+@lru_cache(maxsize=1)
 def find_libreoffice() -> str | None:
     """
     Find the LibreOffice executable.
 
+    The result is cached, since the install location does not change
+    while the script runs.
+
     Returns:
         Path to soffice executable, or None if not found
     """
     system = platform.system()
 
     if system == "Darwin":  # macOS
-        paths = [
-            "/Applications/LibreOffice.app/Contents/MacOS/soffice",
-            shutil.which("soffice"),
-        ]
+        paths = ["/Applications/LibreOffice.app/Contents/MacOS/soffice"]
+        commands = ["soffice"]
     elif system == "Windows":
         paths = [
             r"C:\Program Files\LibreOffice\program\soffice.exe",
             r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
-            shutil.which("soffice"),
         ]
+        commands = ["soffice"]
     else:  # Linux
         paths = [
             "/usr/bin/soffice",
             "/usr/local/bin/soffice",
-            shutil.which("soffice"),
-            shutil.which("libreoffice"),
         ]
+        commands = ["soffice", "libreoffice"]
 
     for path in paths:
-        if path and Path(path).exists():
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+
+    # Only search PATH when no standard install location matched
+    for command in commands:
+        path = shutil.which(command)
+        if path:
             return path
 
     return None
 
 
+def _macro_dir() -> Path:
+    """Get the Standard Basic library folder of the LibreOffice user profile."""
+    system = platform.system()
+
+    if system == "Darwin":
+        return Path.home() / "Library/Application Support/LibreOffice/4/user/basic/Standard"
+    elif system == "Windows":
+        return Path(os.environ.get("APPDATA", "")) / "LibreOffice/4/user/basic/Standard"
+    else:
+        return Path.home() / ".config/libreoffice/4/user/basic/Standard"
+
+
+def _init_libreoffice_profile(soffice: str) -> None:
+    """Start LibreOffice once so it creates its user profile."""
+    try:
+        subprocess.run(
+            [soffice, "--headless", "--terminate_after_init"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+        )
+    except subprocess.TimeoutExpired:
+        pass
+
+
 def setup_libreoffice_macro(soffice: str) -> bool:
     """
     Setup LibreOffice macro for recalculation.
@@ -93,15 +164,7 @@ def setup_libreoffice_macro(soffice: str) -> bool:
     Returns:
         True if setup successful
     """
-    system = platform.system()
-
-    if system == "Darwin":
-        macro_dir = Path.home() / "Library/Application Support/LibreOffice/4/user/basic/Standard"
-    elif system == "Windows":
-        macro_dir = Path(os.environ.get("APPDATA", "")) / "LibreOffice/4/user/basic/Standard"
-    else:
-        macro_dir = Path.home() / ".config/libreoffice/4/user/basic/Standard"
-
+    macro_dir = _macro_dir()
     macro_file = macro_dir / "Module1.xba"
 
     # Check if macro already exists
@@ -110,19 +173,6 @@ def setup_libreoffice_macro(soffice: str) -> bool:
         if "RecalculateAndSave" in content:
             return True
 
-    # Initialize LibreOffice to create directories
-    if not macro_dir.exists():
-        try:
-            subprocess.run(
-                [soffice, "--headless", "--terminate_after_init"],
-                capture_output=True,
-                timeout=30,
-            )
-        except subprocess.TimeoutExpired:
-            pass
-
-        macro_dir.mkdir(parents=True, exist_ok=True)
-
     # Write macro
     macro_content = '''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE script:module PUBLIC "-//OpenOffice.org//DTD OfficeDocument 1.0//EN" "module.dtd">
@@ -134,7 +184,26 @@ def setup_libreoffice_macro(soffice: str) -> bool:
     End Sub
 </script:module>'''
 
+    # Library indexes so LibreOffice registers Module1 without an init run
+    library_indexes = {
+        "script.xlb": '''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE library:library PUBLIC "-//OpenOffice.org//DTD OfficeDocument 1.0//EN" "library.dtd">
+<library:library xmlns:library="http://openoffice.org/2000/library" library:name="Standard" library:readonly="false" library:passwordprotected="false">
+ <library:element library:name="Module1"/>
+</library:library>''',
+        "dialog.xlb": '''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE library:library PUBLIC "-//OpenOffice.org//DTD OfficeDocument 1.0//EN" "library.dtd">
+<library:library xmlns:library="http://openoffice.org/2000/library" library:name="Standard" library:readonly="false" library:passwordprotected="false"/>''',
+    }
+
     try:
+        # Create the profile folders ourselves rather than launching
+        # LibreOffice just to initialize them
+        macro_dir.mkdir(parents=True, exist_ok=True)
+        for name, content in library_indexes.items():
+            index_file = macro_dir / name
+            if not index_file.exists():
+                index_file.write_text(content)
         macro_file.write_text(macro_content)
         return True
     except Exception as e:
@@ -142,23 +211,18 @@ def setup_libreoffice_macro(soffice: str) -> bool:
         return False
 
 
-def recalculate_with_libreoffice(xlsx_path: str, soffice: str, timeout: int) -> bool:
+def _run_recalc_macro(soffice: str, abs_path: str, timeout: int) -> bool:
     """
-    Recalculate formulas using LibreOffice.
+    Run the recalculation macro on a file.
 
     Args:
-        xlsx_path: Path to Excel file
         soffice: Path to soffice executable
+        abs_path: Absolute path to Excel file
         timeout: Timeout in seconds
 
     Returns:
         True if recalculation successful
     """
-    if not setup_libreoffice_macro(soffice):
-        return False
-
-    abs_path = str(Path(xlsx_path).absolute())
-
     # Build command
     cmd = [
         soffice,
@@ -169,10 +233,11 @@ def recalculate_with_libreoffice(xlsx_path: str, soffice: str, timeout: int) ->
     ]
 
     try:
+        # Only the exit status is used; don't pipe and buffer soffice's output
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=timeout,
         )
         return result.returncode == 0
@@ -184,53 +249,403 @@ def recalculate_with_libreoffice(xlsx_path: str, soffice: str, timeout: int) ->
         return False
 
 
-def scan_for_errors(xlsx_path: str) -> dict:
+def recalculate_with_libreoffice(xlsx_path: str, soffice: str, timeout: int) -> bool:
     """
-    Scan Excel file for formula errors.
+    Recalculate formulas using LibreOffice.
 
     Args:
         xlsx_path: Path to Excel file
+        soffice: Path to soffice executable
+        timeout: Timeout in seconds
 
     Returns:
-        Dictionary with error details
+        True if recalculation successful
     """
-    try:
-        # Load with data_only=True to see calculated values
-        wb = load_workbook(xlsx_path, data_only=True)
-    except Exception as e:
-        return {"error": f"Could not load file: {e}"}
-
-    error_details = {err: [] for err in EXCEL_ERRORS}
-    total_errors = 0
-
-    for sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-        for row in ws.iter_rows():
-            for cell in row:
-                if cell.value is not None and isinstance(cell.value, str):
-                    for err in EXCEL_ERRORS:
-                        if err in cell.value:
-                            location = f"{sheet_name}!{cell.coordinate}"
-                            error_details[err].append(location)
-                            total_errors += 1
-                            break
+    new_profile = not _macro_dir().exists()
+    if not setup_libreoffice_macro(soffice):
+        return False
+
+    abs_path = str(Path(xlsx_path).absolute())
+    if _run_recalc_macro(soffice, abs_path, timeout):
+        return True
+
+    # A profile we created may not have been picked up; let LibreOffice
+    # initialize it, then reinstall the macro and retry once
+    if not new_profile:
+        return False
+    _init_libreoffice_profile(soffice)
+    if not setup_libreoffice_macro(soffice):
+        return False
+    return _run_recalc_macro(soffice, abs_path, timeout)
+
+
+class LibreOfficeServer:
+    """
+    A headless LibreOffice kept running to recalculate many files over UNO.
+
+    Starting soffice dominates the cost of recalculating small files, so this
+    starts it once and drives it through the UNO bridge. It runs with its own
+    temporary profile, so it never hands work to a desktop instance. A file
+    that takes longer than the timeout gets LibreOffice killed and restarted.
+
+    Usage:
+        with LibreOfficeServer(soffice) as server:
+            server.recalc("report.xlsx")
+    """
+
+    def __init__(self, soffice: str, timeout: int = 30):
+        """
+        Args:
+            soffice: Path to soffice executable
+            timeout: Seconds to wait for LibreOffice to accept connections,
+                and to recalculate each file
+        """
+        self.soffice = soffice
+        self.timeout = timeout
+        self._process = None
+        self._profile = None
+        self._desktop = None
+
+    def __enter__(self) -> "LibreOfficeServer":
+        # Let the OS pick a free port
+        with socket.socket() as sock:
+            sock.bind(("localhost", 0))
+            port = sock.getsockname()[1]
+        connection = f"socket,host=localhost,port={port};urp;"
+
+        self._profile = tempfile.mkdtemp(prefix="lo_profile_")
+        self._process = subprocess.Popen(
+            [
+                self.soffice,
+                "--headless",
+                "--invisible",
+                "--norestore",
+                "--nologo",
+                f"-env:UserInstallation={Path(self._profile).as_uri()}",
+                f"--accept={connection}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            # Own process group, so _kill also reaches the soffice.bin child
+            start_new_session=os.name == "posix",
+        )
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                context = resolver.resolve(f"uno:{connection}StarOffice.ComponentContext")
+                break
+            except Exception:
+                if time.monotonic() > deadline or self._process.poll() is not None:
+                    self.__exit__(None, None, None)
+                    raise RuntimeError("LibreOffice did not accept connections")
+                time.sleep(0.25)
+
+        self._desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._desktop is not None:
+            try:
+                self._desktop.terminate()
+            except Exception:
+                pass  # The bridge drops as LibreOffice exits
+            self._desktop = None
+
+        if self._process is not None:
+            try:
+                self._process.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                self._kill()
+                self._process.wait()
+            self._process = None
+
+        if self._profile is not None:
+            shutil.rmtree(self._profile, ignore_errors=True)
+            self._profile = None
+
+    def _kill(self) -> None:
+        """Kill LibreOffice, along with any process its launcher started."""
+        if os.name == "posix":
+            try:
+                os.killpg(self._process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass  # Already gone
+        else:
+            self._process.kill()
+
+    def recalc(self, xlsx_path: str) -> bool:
+        """
+        Recalculate and save a file in the running LibreOffice.
+
+        Args:
+            xlsx_path: Path to Excel file
+
+        Returns:
+            True if recalculation successful
+        """
+        if self._process.poll() is not None:
+            # Killed over the previous file or crashed; start a fresh one
+            self.__exit__(None, None, None)
+            self.__enter__()
+
+        url = uno.systemPathToFileUrl(str(Path(xlsx_path).absolute()))
+        hidden = PropertyValue()
+        hidden.Name = "Hidden"
+        hidden.Value = True
+
+        # Killing LibreOffice drops the bridge, which fails the pending call
+        watchdog = threading.Timer(self.timeout, self._kill)
+        watchdog.start()
+        try:
+            doc = self._desktop.loadComponentFromURL(url, "_blank", 0, (hidden,))
+            try:
+                doc.calculateAll()
+                doc.store()
+            finally:
+                doc.close(True)
+            return True
+        except Exception as e:
+            if watchdog.finished.is_set():
+                print(f"Warning: LibreOffice timed out on {xlsx_path}", file=sys.stderr)
+            else:
+                print(f"Warning: LibreOffice error on {xlsx_path}: {e}", file=sys.stderr)
+            return False
+        finally:
+            watchdog.cancel()
+
+
+def recalculate_files(xlsx_paths: list[str], soffice: str, timeout: int) -> list[bool]:
+    """
+    Recalculate formulas in several files using LibreOffice.
+
+    Uses one LibreOffice server for all files when the UNO bridge is
+    available, otherwise runs the macro once per file.
+
+    Args:
+        xlsx_paths: Paths to Excel files
+        soffice: Path to soffice executable
+        timeout: Timeout in seconds
+
+    Returns:
+        Whether recalculation succeeded, for each file in order
+    """
+    results = []
+    if uno is not None and len(xlsx_paths) > 1:
+        try:
+            with LibreOfficeServer(soffice, timeout) as server:
+                for path in xlsx_paths:
+                    results.append(server.recalc(path))
+        except (OSError, RuntimeError) as e:
+            print(f"Warning: {e}, recalculating files one at a time", file=sys.stderr)
+
+    # Files the server did not get to, if it could not be (re)started
+    return results + [
+        recalculate_with_libreoffice(path, soffice, timeout)
+        for path in xlsx_paths[len(results):]
+    ]
+
+
+def _find_error(value: str) -> str | None:
+    """Return the Excel error a cell value contains, if any."""
+    if "#" not in value:
+        return None
+    found = _ERROR_RE.findall(value)
+    if not found:
+        return None
+    return min(found, key=_ERROR_RANK.__getitem__)
+
+
+def _record_error(error_details: dict[str, dict], err: str, location: str) -> None:
+    """Count an error and keep its location if under the reporting limit."""
+    details = error_details[err]
+    details["count"] += 1
+    if len(details["locations"]) < MAX_ERROR_LOCATIONS:
+        details["locations"].append(location)
+
+
+def _related_parts(z: zipfile.ZipFile, part: str, rel_type: str) -> dict[str, str]:
+    """
+    Resolve a part's relationships of one type to package paths.
+
+    Args:
+        z: Open .xlsx package
+        part: Source part path, or "" for the package itself
+        rel_type: Suffix of the relationship type URI, like "/worksheet"
+
+    Returns:
+        Dictionary of {relationship_id: part_path}
+    """
+    folder, name = posixpath.split(part)
+    rels = ET.fromstring(z.read(posixpath.join(folder, "_rels", name + ".rels")))
+
+    targets = {}
+    for rel in rels.iter(_PKG_REL):
+        if not rel.get("Type", "").endswith(rel_type) or rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target")
+        if target.startswith("/"):
+            targets[rel.get("Id")] = target[1:]
+        else:
+            targets[rel.get("Id")] = posixpath.normpath(posixpath.join(folder, target))
+    return targets
+
+
+def _string_content(item: ET.Element) -> str:
+    """Join a string item's text and rich text runs, skipping phonetic hints."""
+    return "".join(t.text or "" for t in item.findall(_T) + item.findall(_R_T))
+
+
+def _scan_package(xlsx_path: str) -> tuple[dict[str, dict], int]:
+    """
+    Find error values and count formulas in one pass over the sheet XML.
+
+    Reads cached values and formulas from the same cells, so each worksheet
+    is decompressed and parsed once. Matches what openpyxl reports with
+    data_only=True (errors) and data_only=False (formulas).
+
+    Args:
+        xlsx_path: Path to Excel file
+
+    Returns:
+        Tuple of (error count and locations by error type, formula count)
+    """
+    error_details = {err: {"count": 0, "locations": []} for err in EXCEL_ERRORS}
+    formula_count = 0
+
+    with zipfile.ZipFile(xlsx_path) as z:
+        (workbook,) = _related_parts(z, "", "/officeDocument").values()
+        worksheets = _related_parts(z, workbook, "/worksheet")
+
+        # Classify each shared string once rather than at every cell using it
+        shared = []
+        for part in _related_parts(z, workbook, "/sharedStrings").values():
+            with z.open(part) as src:
+                for _, elem in ET.iterparse(src):
+                    if elem.tag == _SI:
+                        text = _string_content(elem)
+                        shared.append((_find_error(text), text.startswith("=")))
+                        elem.clear()
+
+        sheets = ET.fromstring(z.read(workbook)).iter(_SHEET)
+        for sheet in sheets:
+            part = worksheets.get(sheet.get(_REL_ID))
+            if part is None:
+                continue  # Chartsheets and dialog sheets hold no cells
+            sheet_name = sheet.get("name")
+
+            with z.open(part) as src:
+                for _, row in ET.iterparse(src):
+                    if row.tag != _ROW:
+                        continue
+                    for cell in row.iter(_C):
+                        formula = cell.find(_F)
+                        if formula is not None and formula.get("t") != "array":
+                            formula_count += 1
+
+                        cell_type = cell.get("t")
+                        if cell_type == "s":
+                            err, starts_with_eq = shared[int(cell.findtext(_V))]
+                        else:
+                            if cell_type == "str" or cell_type == "e":
+                                text = cell.findtext(_V)
+                            elif cell_type == "inlineStr":
+                                item = cell.find(_IS)
+                                text = _string_content(item) if item is not None else None
+                            else:
+                                continue
+                            if not text:
+                                continue
+                            # Errors always start with "#"; skip the call for most text
+                            err = _find_error(text) if "#" in text else None
+                            starts_with_eq = text.startswith("=")
+
+                        # Without data_only, openpyxl reports "=..." text as a formula
+                        if starts_with_eq and formula is None:
+                            formula_count += 1
+                        if err:
+                            ref = cell.get("r")
+                            if ref is None:
+                                raise ValueError("Cell without a reference")
+                            _record_error(error_details, err, f"{sheet_name}!{ref}")
+                    row.clear()
+
+    return error_details, formula_count
+
+
+def _scan_with_openpyxl(xlsx_path: str) -> tuple[dict[str, dict], int]:
+    """
+    Find error values and count formulas using openpyxl.
+
+    Args:
+        xlsx_path: Path to Excel file
+
+    Returns:
+        Tuple of (error count and locations by error type, formula count or -1)
+    """
+    # Load with data_only=True to see calculated values; read-only mode
+    # streams rows instead of building every cell object
+    wb = load_workbook(xlsx_path, data_only=True, read_only=True, keep_links=False)
+
+    error_details = {err: {"count": 0, "locations": []} for err in EXCEL_ERRORS}
+
+    for ws in wb.worksheets:
+        # Ignore the stored dimension, which may be missing or stale
+        ws.reset_dimensions()
+        for row_idx, row in enumerate(ws.iter_rows(min_row=1, min_col=1, values_only=True), start=1):
+            for col_idx, value in enumerate(row, start=1):
+                if type(value) is str and "#" in value:
+                    err = _find_error(value)
+                    if err:
+                        location = f"{ws.title}!{get_column_letter(col_idx)}{row_idx}"
+                        _record_error(error_details, err, location)
 
     wb.close()
 
     # Count formulas
     try:
-        wb_formulas = load_workbook(xlsx_path, data_only=False)
+        wb_formulas = load_workbook(xlsx_path, data_only=False, read_only=True, keep_links=False)
         formula_count = 0
-        for sheet_name in wb_formulas.sheetnames:
-            ws = wb_formulas[sheet_name]
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value and isinstance(cell.value, str) and cell.value.startswith("="):
+        for ws in wb_formulas.worksheets:
+            ws.reset_dimensions()
+            for row in ws.iter_rows(values_only=True):
+                for value in row:
+                    if type(value) is str and value.startswith("="):
                         formula_count += 1
         wb_formulas.close()
     except Exception:
         formula_count = -1
 
+    return error_details, formula_count
+
+
+def scan_for_errors(xlsx_path: str) -> dict:
+    """
+    Scan Excel file for formula errors.
+
+    Args:
+        xlsx_path: Path to Excel file
+
+    Returns:
+        Dictionary with error details
+    """
+    try:
+        error_details, formula_count = _scan_package(xlsx_path)
+    except (KeyError, ValueError, TypeError, OSError, zipfile.BadZipFile, ET.ParseError):
+        # Unusual package layout; let openpyxl make sense of it
+        try:
+            error_details, formula_count = _scan_with_openpyxl(xlsx_path)
+        except Exception as e:
+            return {"error": f"Could not load file: {e}"}
+
+    total_errors = sum(details["count"] for details in error_details.values())
+
     # Build result
     result = {
         "status": "success" if total_errors == 0 else "errors_found",
@@ -239,16 +654,53 @@ def scan_for_errors(xlsx_path: str) -> dict:
         "error_summary": {},
     }
 
-    for err_type, locations in error_details.items():
-        if locations:
-            result["error_summary"][err_type] = {
-                "count": len(locations),
-                "locations": locations[:20],  # Limit to first 20
-            }
+    for err_type, details in error_details.items():
+        if details["count"]:
+            result["error_summary"][err_type] = details
 
     return result
 
 
+def scan_batch(xlsx_paths: list[str]) -> list[dict]:
+    """
+    Scan several Excel files for formula errors, in parallel.
+
+    Each worker process scans many files, so interpreter startup and imports
+    are paid once per worker rather than once per file.
+
+    Args:
+        xlsx_paths: Paths to Excel files
+
+    Returns:
+        Result of scan_for_errors for each file, in order
+    """
+    workers = min(len(xlsx_paths), os.cpu_count() or 1)
+    if workers < 2:
+        return [scan_for_errors(path) for path in xlsx_paths]
+
+    with Pool(workers) as pool:
+        return pool.map(scan_for_errors, xlsx_paths)
+
+
+def print_result(xlsx_path: str, result: dict) -> None:
+    """Print a scan result in human-readable form."""
+    print(f"\nFile: {xlsx_path}")
+    print(f"Recalculated: {'Yes' if result['recalculated'] else 'No'}")
+    print(f"Total formulas: {result.get('total_formulas', 'Unknown')}")
+    print(f"Total errors: {result.get('total_errors', 0)}")
+
+    if result.get("error_summary"):
+        print("\nErrors found:")
+        for err_type, details in result["error_summary"].items():
+            print(f"  {err_type}: {details['count']} occurrence(s)")
+            for loc in details["locations"][:5]:
+                print(f"    - {loc}")
+            if len(details["locations"]) > 5:
+                print(f"    ... and {len(details['locations']) - 5} more")
+    else:
+        print("\nNo formula errors detected!")
+
+
 def main():
     import argparse
 
@@ -258,8 +710,15 @@ def main():
     )
     parser.add_argument(
         "xlsx_file",
+        nargs="?",
         help="Path to Excel file",
     )
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="XLSX_FILE",
+        help="Check several Excel files, scanning them in parallel",
+    )
     parser.add_argument(
         "--timeout",
         "-t",
@@ -280,23 +739,32 @@ def main():
 
     args = parser.parse_args()
 
-    # Validate file exists
-    if not Path(args.xlsx_file).exists():
-        print(f"Error: File not found: {args.xlsx_file}", file=sys.stderr)
-        sys.exit(1)
+    if args.batch:
+        xlsx_files = ([args.xlsx_file] if args.xlsx_file else []) + args.batch
+    elif args.xlsx_file:
+        xlsx_files = [args.xlsx_file]
+    else:
+        parser.error("an Excel file or --batch is required")
+
+    # Validate files exist
+    for xlsx_file in xlsx_files:
+        if not Path(xlsx_file).exists():
+            print(f"Error: File not found: {xlsx_file}", file=sys.stderr)
+            sys.exit(1)
 
     # Find LibreOffice
     soffice = find_libreoffice()
-    recalc_success = False
+    recalc_results = [False] * len(xlsx_files)
 
     if not args.no_recalc:
         if soffice:
             print(f"Found LibreOffice: {soffice}", file=sys.stderr)
             print("Recalculating formulas...", file=sys.stderr)
-            recalc_success = recalculate_with_libreoffice(
-                args.xlsx_file, soffice, args.timeout
-            )
-            if recalc_success:
+            if len(xlsx_files) == 1:
+                recalc_results = [recalculate_with_libreoffice(xlsx_files[0], soffice, args.timeout)]
+            else:
+                recalc_results = recalculate_files(xlsx_files, soffice, args.timeout)
+            if all(recalc_results):
                 print("Recalculation complete.", file=sys.stderr)
             else:
                 print("Recalculation failed, scanning existing values...", file=sys.stderr)
@@ -314,28 +782,23 @@ def main():
             print("  Windows: Download from libreoffice.org", file=sys.stderr)
 
     # Scan for errors
-    result = scan_for_errors(args.xlsx_file)
-    result["recalculated"] = recalc_success
+    if args.batch:
+        results = scan_batch(xlsx_files)
+    else:
+        results = [scan_for_errors(xlsx_files[0])]
+    for result, recalc_success in zip(results, recalc_results):
+        result["recalculated"] = recalc_success
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        if args.batch:
+            output = [{"file": xlsx_file, **result} for xlsx_file, result in zip(xlsx_files, results)]
+        else:
+            output = results[0]
+        print(json.dumps(output, indent=2))
     else:
         # Human-readable output
-        print(f"\nFile: {args.xlsx_file}")
-        print(f"Recalculated: {'Yes' if recalc_success else 'No'}")
-        print(f"Total formulas: {result.get('total_formulas', 'Unknown')}")
-        print(f"Total errors: {result.get('total_errors', 0)}")
-
-        if result.get("error_summary"):
-            print("\nErrors found:")
-            for err_type, details in result["error_summary"].items():
-                print(f"  {err_type}: {details['count']} occurrence(s)")
-                for loc in details["locations"][:5]:
-                    print(f"    - {loc}")
-                if len(details["locations"]) > 5:
-                    print(f"    ... and {len(details['locations']) - 5} more")
-        else:
-            print("\nNo formula errors detected!")
+        for xlsx_file, result in zip(xlsx_files, results):
+            print_result(xlsx_file, result)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,591 @@
+/**
+ * Regression tests for the document-creator skill's Python scripts.
+ *
+ * The scripts run under `uvx --with ...` in production. These tests call them
+ * with the local python3 instead, and are SKIPPED when python3 or the
+ * packages the scripts import (lxml, openpyxl) are not available.
+ */
+
+import { test, expect, describe, beforeEach, afterEach } from 'bun:test';
+import fs from 'fs/promises';
+import { existsSync } from 'fs';
+import path from 'path';
+import os from 'os';
+
+const SCRIPTS_DIR = path.join(
+    import.meta.dir,
+    '../../src/server/skills/builtin/document-creator/scripts'
+);
+
+const W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main';
+
+function hasPython(): boolean {
+    try {
+        return Bun.spawnSync(['python3', '-c', 'import lxml, openpyxl']).exitCode === 0;
+    } catch {
+        return false;
+    }
+}
+
+function runScript(script: string, args: string[]) {
+    const proc = Bun.spawnSync(['python3', path.join(SCRIPTS_DIR, script), ...args], {
+        stdout: 'pipe',
+        stderr: 'pipe',
+        timeout: 30_000,
+    });
+    return {
+        exitCode: proc.exitCode,
+        stdout: proc.stdout.toString(),
+        stderr: proc.stderr.toString(),
+    };
+}
+
+async function writeDocument(folder: string, body: string): Promise<string> {
+    const docPath = path.join(folder, 'word', 'document.xml');
+    await fs.mkdir(path.dirname(docPath), { recursive: true });
+    await fs.writeFile(
+        docPath,
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' +
+            `<w:document xmlns:w="${W_NS}"><w:body>${body}</w:body></w:document>`
+    );
+    return docPath;
+}
+
+function runPython(code: string, args: string[] = []): string {
+    const proc = Bun.spawnSync(['python3', '-c', code, ...args], { stdout: 'pipe', stderr: 'pipe' });
+    if (proc.exitCode !== 0) {
+        throw new Error(proc.stderr.toString());
+    }
+    return proc.stdout.toString();
+}
+
+/**
+ * Write a minimal .docx. Members are deliberately out of the usual order,
+ * and the media and package relationships are stored rather than deflated.
+ */
+function writeDocx(docxPath: string, body: string): void {
+    runPython(`
+import sys, zipfile
+path, body = sys.argv[1], sys.argv[2]
+doc = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\\n'
+doc += '<w:document xmlns:w="${W_NS}"><w:body>' + body + '</w:body></w:document>'
+with zipfile.ZipFile(path, "w") as z:
+    z.writestr("word/document.xml", doc, zipfile.ZIP_DEFLATED)
+    z.writestr("word/media/image1.png", b"\\x89PNG not really", zipfile.ZIP_STORED)
+    z.writestr(
+        "[Content_Types].xml",
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"/>',
+        zipfile.ZIP_DEFLATED,
+    )
+    z.writestr(
+        "_rels/.rels",
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"/>',
+        zipfile.ZIP_STORED,
+    )
+`, [docxPath, body]);
+}
+
+/** Text of one member of a ZIP package. */
+function readPart(zipPath: string, name: string): string {
+    return runPython(
+        'import sys, zipfile; print(zipfile.ZipFile(sys.argv[1]).read(sys.argv[2]).decode())',
+        [zipPath, name]
+    );
+}
+
+/** [name, compress_type] for each member of a ZIP package, in order. */
+function readMembers(zipPath: string): [string, number][] {
+    return JSON.parse(runPython(`
+import json, sys, zipfile
+print(json.dumps([[i.filename, i.compress_type] for i in zipfile.ZipFile(sys.argv[1]).infolist()]))
+`, [zipPath]));
+}
+
+/** Visible text of each paragraph, from a document.xml or a packed .docx. */
+function readParagraphs(filePath: string): string[] {
+    return JSON.parse(runPython(`
+import json, sys, zipfile
+from lxml import etree
+path = sys.argv[1]
+if zipfile.is_zipfile(path):
+    data = zipfile.ZipFile(path).read("word/document.xml")
+else:
+    data = open(path, "rb").read()
+W = "{${W_NS}}"
+root = etree.fromstring(data)
+print(json.dumps(["".join(t.text or "" for t in p.iter(W + "t")) for p in root.iter(W + "p")]))
+`, [filePath]));
+}
+
+interface CellInfo {
+    value: string | number | boolean | null;
+    bold: boolean;
+    fill: string | null;
+    numberFormat: string;
+}
+
+/** Non-empty cells of each sheet as openpyxl loads them, keyed by coordinate. */
+function readCells(xlsxPath: string): Record<string, Record<string, CellInfo>> {
+    return JSON.parse(runPython(`
+import json, sys
+from openpyxl import load_workbook
+wb = load_workbook(sys.argv[1])
+print(json.dumps({
+    ws.title: {
+        cell.coordinate: {
+            "value": cell.value,
+            "bold": bool(cell.font.b),
+            "fill": cell.fill.fgColor.rgb if cell.fill.fill_type == "solid" else None,
+            "numberFormat": cell.number_format,
+        }
+        for row in ws.iter_rows() for cell in row if cell.value is not None
+    }
+    for ws in wb.worksheets
+}))
+`, [xlsxPath]));
+}
+
+/** Text a reader sees: <w:t> content outside tracked deletions. */
+function visibleText(xml: string): string {
+    const kept = xml.replace(/<w:del\b[\s\S]*?<\/w:del>/g, '');
+    return [...kept.matchAll(/<w:t(?:\s[^>]*)?>([^<]*)<\/w:t>/g)].map((m) => m[1]).join('');
+}
+
+describe('document-creator scripts', () => {
+    const testFn = hasPython() ? test : test.skip;
+    let testDir: string;
+
+    beforeEach(async () => {
+        testDir = await fs.mkdtemp(path.join(os.tmpdir(), 'document-creator-'));
+    });
+
+    afterEach(async () => {
+        await fs.rm(testDir, { recursive: true, force: true });
+    });
+
+    describe('docx_edit.py', () => {
+        testFn('does not replace inside entity references', async () => {
+            const docPath = await writeDocument(
+                testDir,
+                '<w:p><w:r><w:t>Profit &amp; Loss</w:t></w:r></w:p>'
+            );
+
+            const result = runScript('docx_edit.py', [
+                '--folder', testDir, '--action', 'replace', '--find', 'amp', '--replace', 'x',
+            ]);
+
+            expect(result.exitCode).toBe(0);
+            expect(result.stdout).toContain('Made 0 replacement(s)');
+            const xml = await fs.readFile(docPath, 'utf-8');
+            expect(xml).toContain('Profit &amp; Loss');
+        });
+
+        testFn('replaces text also written as a character reference', async () => {
+            const docPath = await writeDocument(
+                testDir,
+                '<w:p><w:r><w:t>caf&#233; one</w:t></w:r></w:p>' +
+                    '<w:p><w:r><w:t>café two</w:t></w:r></w:p>'
+            );
+
+            const result = runScript('docx_edit.py', [
+                '--folder', testDir, '--action', 'replace', '--find', 'café', '--replace', 'tea',
+            ]);
+
+            expect(result.exitCode).toBe(0);
+            expect(result.stdout).toContain('Made 2 replacement(s)');
+            const xml = await fs.readFile(docPath, 'utf-8');
+            expect(visibleText(xml)).toBe('tea onetea two');
+        });
+
+        testFn.each([
+            ['a & b', 'a &amp; b', 'a &#38; b'],
+            ['a < b', 'a &lt; b', 'a &#60; b'],
+            ['a > b', 'a &gt; b', 'a > b'],
+        ])('replaces every spelling of %p', async (find, first, second) => {
+            const docPath = await writeDocument(
+                testDir,
+                `<w:p><w:r><w:t>${first}</w:t></w:r></w:p>` +
+                    `<w:p><w:r><w:t>${second}</w:t></w:r></w:p>`
+            );
+
+            const result = runScript('docx_edit.py', [
+                '--folder', testDir, '--action', 'replace', '--find', find, '--replace', 'c',
+            ]);
+
+            expect(result.exitCode).toBe(0);
+            expect(result.stdout).toContain('Made 2 replacement(s)');
+            const xml = await fs.readFile(docPath, 'utf-8');
+            expect(visibleText(xml)).toBe('cc');
+        });
+
+        testFn('replaces text containing escaped markup characters', async () => {
+            const docPath = await writeDocument(
+                testDir,
+                '<w:p><w:r><w:t>a &gt; b</w:t></w:r></w:p>'
+            );
+
+            const result = runScript('docx_edit.py', [
+                '--folder', testDir, '--action', 'replace', '--find', 'a > b', '--replace', 'c',
+            ]);
+
+            expect(result.exitCode).toBe(0);
+            expect(result.stdout).toContain('Made 1 replacement(s)');
+            const xml = await fs.readFile(docPath, 'utf-8');
+            expect(xml).toContain('<w:t>c</w:t>');
+        });
+
+        testFn.each([false, true])(
+            'replaces every find in a run with --pairs (track changes: %p)',
+            async (trackChanges) => {
+                const docPath = await writeDocument(
+                    testDir,
+                    '<w:p><w:r><w:t>foo bar</w:t></w:r></w:p>'
+                );
+                const pairsPath = path.join(testDir, 'pairs.json');
+                await fs.writeFile(pairsPath, JSON.stringify([['foo', 'X'], ['bar', 'Y']]));
+
+                const result = runScript('docx_edit.py', [
+                    '--folder', testDir, '--action', 'replace', '--pairs', pairsPath,
+                    ...(trackChanges ? ['--track-changes'] : []),
+                ]);
+
+                expect(result.exitCode).toBe(0);
+                const xml = await fs.readFile(docPath, 'utf-8');
+                expect(visibleText(xml)).toBe('X Y');
+                if (trackChanges) {
+                    expect(xml).toContain('<w:delText>foo</w:delText>');
+                    expect(xml).toContain('<w:delText>bar</w:delText>');
+                }
+            }
+        );
+
+        testFn('assigns fresh change IDs when the namespace uses another prefix', async () => {
+            const docPath = path.join(testDir, 'word', 'document.xml');
+            await fs.mkdir(path.dirname(docPath), { recursive: true });
+            await fs.writeFile(
+                docPath,
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' +
+                    `<x:document xmlns:x="${W_NS}"><x:body><x:p>` +
+                    '<x:bookmarkStart x:id="1" x:name="b"/><x:r><x:t>foo</x:t></x:r>' +
+                    '</x:p></x:body></x:document>'
+            );
+
+            const result = runScript('docx_edit.py', [
+                '--folder', testDir, '--action', 'replace', '--find', 'foo', '--replace', 'bar',
+                '--track-changes',
+            ]);
+
+            expect(result.exitCode).toBe(0);
+            const xml = await fs.readFile(docPath, 'utf-8');
+            const ids = [...xml.matchAll(/:id="(\d+)"/g)].map((m) => m[1]);
+            expect(ids.length).toBe(3);
+            expect(new Set(ids).size).toBe(ids.length);
+        });
+
+        testFn.each([false, true])(
+            'applies a list of edits with --ops (track changes: %p)',
+            async (trackChanges) => {
+                const docPath = await writeDocument(
+                    testDir,
+                    '<w:p><w:r><w:t>Alpha beta gamma</w:t></w:r></w:p>' +
+                        '<w:p><w:r><w:t>beta</w:t></w:r></w:p>'
+                );
+                const opsPath = path.join(testDir, 'ops.json');
+                await fs.writeFile(opsPath, JSON.stringify([
+                    { action: 'replace', find: 'beta', replace: 'B' },
+                    { action: 'insert', after: 'Alpha', text: ' one' },
+                    { action: 'delete', find: ' gamma' },
+                ]));
+
+                const result = runScript('docx_edit.py', [
+                    '--folder', testDir, '--ops', opsPath,
+                    ...(trackChanges ? ['--track-changes'] : []),
+                ]);
+
+                expect(result.exitCode).toBe(0);
+                expect(result.stdout).toContain('Made 4 edit(s)');
+                expect(readParagraphs(docPath)).toEqual(['Alpha one B', 'B']);
+                if (trackChanges) {
+                    const settings = await fs.readFile(
+                        path.join(testDir, 'word', 'settings.xml'), 'utf-8'
+                    );
+                    expect(settings).toContain('trackRevisions');
+                }
+            }
+        );
+
+        testFn('edits a packed .docx with --input and --output', async () => {
+            const inputPath = path.join(testDir, 'in.docx');
+            const outputPath = path.join(testDir, 'out.docx');
+            writeDocx(inputPath, '<w:p><w:r><w:t>Profit and Loss</w:t></w:r></w:p>');
+
+            const result = runScript('docx_edit.py', [
+                '--input', inputPath, '--output', outputPath,
+                '--action', 'replace', '--find', 'Profit', '--replace', 'Revenue',
+            ]);
+
+            expect(result.exitCode).toBe(0);
+            expect(result.stdout).toContain('Made 1 replacement(s)');
+            expect(readParagraphs(outputPath)).toEqual(['Revenue and Loss']);
+            expect(readParagraphs(inputPath)).toEqual(['Profit and Loss']);
+            // Every other member is copied across with its name, order and compression
+            expect(readMembers(outputPath)).toEqual(readMembers(inputPath));
+        });
+
+        testFn('edits a packed .docx in place with tracked changes', async () => {
+            const docxPath = path.join(testDir, 'report.docx');
+            writeDocx(docxPath, '<w:p><w:r><w:t>Profit and Loss</w:t></w:r></w:p>');
+
+            const result = runScript('docx_edit.py', [
+                '--input', docxPath, '--action', 'replace', '--find', 'Profit', '--replace', 'Revenue',
+                '--track-changes',
+            ]);
+
+            expect(result.exitCode).toBe(0);
+            expect(readParagraphs(docxPath)).toEqual(['Revenue and Loss']);
+            expect(readMembers(docxPath).map(([name]) => name)).toContain('word/settings.xml');
+        });
+
+        testFn('rejects empty find text in replacement pairs', async () => {
+            await writeDocument(testDir, '<w:p><w:r><w:t>Profit</w:t></w:r></w:p>');
+            const pairsPath = path.join(testDir, 'pairs.json');
+            await fs.writeFile(pairsPath, JSON.stringify([['', 'x']]));
+
+            const result = runScript('docx_edit.py', [
+                '--folder', testDir, '--action', 'replace', '--pairs', pairsPath,
+            ]);
+
+            expect(result.exitCode).toBe(1);
+            expect(result.stderr).toContain('Find text must not be empty');
+        });
+    });
+
+    describe('docx_unpack.py and docx_pack.py', () => {
+        testFn('round-trips member order and compression', async () => {
+            const inputPath = path.join(testDir, 'in.docx');
+            const folder = path.join(testDir, 'unpacked');
+            const outputPath = path.join(testDir, 'out.docx');
+            writeDocx(inputPath, '<w:p><w:r><w:t>Profit and Loss</w:t></w:r></w:p>');
+
+            expect(runScript('docx_unpack.py', [inputPath, '--output', folder]).exitCode).toBe(0);
+            expect(existsSync(path.join(folder, '.zipmeta.json'))).toBe(true);
+            expect(runScript('docx_pack.py', [folder, '--output', outputPath]).exitCode).toBe(0);
+
+            // Packed in the standard order, each member keeping its original
+            // compression (0 = stored, 8 = deflated), without the metadata file
+            expect(readMembers(outputPath)).toEqual([
+                ['[Content_Types].xml', 8],
+                ['_rels/.rels', 0],
+                ['word/document.xml', 8],
+                ['word/media/image1.png', 0],
+            ]);
+            expect(readParagraphs(outputPath)).toEqual(['Profit and Loss']);
+        });
+
+        testFn('refuses to unpack members outside the output folder', async () => {
+            const inputPath = path.join(testDir, 'evil.docx');
+            runPython(`
+import sys, zipfile
+with zipfile.ZipFile(sys.argv[1], "w") as z:
+    z.writestr("../escaped.txt", "x")
+`, [inputPath]);
+
+            const result = runScript('docx_unpack.py', [
+                inputPath, '--output', path.join(testDir, 'unpacked'),
+            ]);
+
+            expect(result.exitCode).toBe(1);
+            expect(result.stderr).toContain('Unsafe path in archive');
+            expect(existsSync(path.join(testDir, 'escaped.txt'))).toBe(false);
+        });
+    });
+
+    describe('xlsx_create.py', () => {
+        testFn('accepts formatting options with object values', async () => {
+            const specPath = path.join(testDir, 'spec.json');
+            const outputPath = path.join(testDir, 'out.xlsx');
+            await fs.writeFile(specPath, JSON.stringify({
+                sheets: [{
+                    name: 'Sheet1',
+                    data: [['a', 'b']],
+                    formatting: { 'A1:B1': { border: { style: 'thin' }, bold: true } },
+                }],
+            }));
+
+            const result = runScript('xlsx_create.py', ['--spec', specPath, '-o', outputPath]);
+
+            expect(result.exitCode).toBe(0);
+            expect(result.stdout).toContain('Created:');
+        });
+
+        testFn('adds a styled sheet to an existing workbook', async () => {
+            const specPath = path.join(testDir, 'spec.json');
+            const sheetPath = path.join(testDir, 'sheet.json');
+            const inputPath = path.join(testDir, 'in.xlsx');
+            const outputPath = path.join(testDir, 'out.xlsx');
+            await fs.writeFile(specPath, JSON.stringify({
+                sheets: [{
+                    name: 'Data',
+                    data: [['Item', 'Amount'], ['Rent', 1200], ['Power', 80.5]],
+                    formatting: {
+                        'A1:B1': { bold: true, fill: '#4472C4' },
+                        'B2:B3': { numberFormat: '#,##0.00' },
+                    },
+                }],
+            }));
+            await fs.writeFile(sheetPath, JSON.stringify({
+                name: 'Data',
+                data: [['Share', 'Total'], [0.25, '=SUM(Data!B2:B3)']],
+                formatting: {
+                    'A1:B1': { fill: '#FF0000' },
+                    'A2': { numberFormat: '0.0%', bold: true },
+                },
+            }));
+
+            expect(runScript('xlsx_create.py', ['--spec', specPath, '-o', inputPath]).exitCode).toBe(0);
+            const result = runScript('xlsx_create.py', [
+                '--action', 'add_sheet', '--input', inputPath, '--spec', sheetPath, '-o', outputPath,
+            ]);
+
+            expect(result.exitCode).toBe(0);
+            expect(result.stdout).toContain("Added sheet 'Data_1'");
+            const cells = readCells(outputPath);
+            // The existing sheet keeps its values and styles
+            expect(cells.Data).toEqual(readCells(inputPath).Data);
+            // The new sheet's style indexes point at its own formatting
+            expect(cells.Data_1).toEqual({
+                A1: { value: 'Share', bold: false, fill: 'FFFF0000', numberFormat: 'General' },
+                B1: { value: 'Total', bold: false, fill: 'FFFF0000', numberFormat: 'General' },
+                A2: { value: 0.25, bold: true, fill: null, numberFormat: '0.0%' },
+                B2: { value: '=SUM(Data!B2:B3)', bold: false, fill: null, numberFormat: 'General' },
+            });
+        });
+
+        testFn('updates strings, numbers and formulas in place', async () => {
+            const specPath = path.join(testDir, 'spec.json');
+            const updatePath = path.join(testDir, 'update.json');
+            const inputPath = path.join(testDir, 'in.xlsx');
+            const outputPath = path.join(testDir, 'out.xlsx');
+            await fs.writeFile(specPath, JSON.stringify({
+                sheets: [{
+                    name: 'Data',
+                    data: [['Item', null, 'Amount'], ['Rent', null, 1200], ['Power', null, 80.5]],
+                    formatting: {
+                        'A1:C1': { bold: true, fill: '#4472C4' },
+                        'C2:C3': { numberFormat: '#,##0.00' },
+                    },
+                }],
+            }));
+            await fs.writeFile(updatePath, JSON.stringify({
+                Data: {
+                    A1: 'Name',
+                    B2: 'monthly',
+                    C2: 1300,
+                    C3: 2.5,
+                    A5: 'Total',
+                    C5: '=SUM(C2:C3)',
+                },
+            }));
+
+            expect(runScript('xlsx_create.py', ['--spec', specPath, '-o', inputPath]).exitCode).toBe(0);
+            const result = runScript('xlsx_create.py', [
+                '--action', 'update', '--input', inputPath, '--spec', updatePath, '-o', outputPath,
+            ]);
+
+            expect(result.exitCode).toBe(0);
+            expect(readCells(outputPath).Data).toEqual({
+                // Existing cells keep their styles
+                A1: { value: 'Name', bold: true, fill: 'FF4472C4', numberFormat: 'General' },
+                C1: { value: 'Amount', bold: true, fill: 'FF4472C4', numberFormat: 'General' },
+                A2: { value: 'Rent', bold: false, fill: null, numberFormat: 'General' },
+                B2: { value: 'monthly', bold: false, fill: null, numberFormat: 'General' },
+                C2: { value: 1300, bold: false, fill: null, numberFormat: '#,##0.00' },
+                A3: { value: 'Power', bold: false, fill: null, numberFormat: 'General' },
+                C3: { value: 2.5, bold: false, fill: null, numberFormat: '#,##0.00' },
+                A5: { value: 'Total', bold: false, fill: null, numberFormat: 'General' },
+                C5: { value: '=SUM(C2:C3)', bold: false, fill: null, numberFormat: 'General' },
+            });
+
+            // New cells and rows go in row and column order, as Excel requires
+            const sheet = readPart(outputPath, 'xl/worksheets/sheet1.xml');
+            expect(sheet.indexOf('r="A2"')).toBeLessThan(sheet.indexOf('r="B2"'));
+            expect(sheet.indexOf('r="B2"')).toBeLessThan(sheet.indexOf('r="C2"'));
+            expect(sheet.indexOf('<row r="3"')).toBeLessThan(sheet.indexOf('<row r="5"'));
+        });
+
+        testFn('writes updated error values as error cells', async () => {
+            const specPath = path.join(testDir, 'spec.json');
+            const updatePath = path.join(testDir, 'update.json');
+            const inputPath = path.join(testDir, 'in.xlsx');
+            const outputPath = path.join(testDir, 'out.xlsx');
+            await fs.writeFile(specPath, JSON.stringify({
+                sheets: [{ name: 'Sheet1', data: [['a', 1]] }],
+            }));
+            await fs.writeFile(updatePath, JSON.stringify({ Sheet1: { B1: '#N/A', C1: '#NOPE' } }));
+
+            expect(runScript('xlsx_create.py', ['--spec', specPath, '-o', inputPath]).exitCode).toBe(0);
+            const result = runScript('xlsx_create.py', [
+                '--action', 'update', '--input', inputPath, '--spec', updatePath, '-o', outputPath,
+            ]);
+            expect(result.exitCode).toBe(0);
+
+            const sheet = readPart(outputPath, 'xl/worksheets/sheet1.xml');
+            expect(sheet).toContain('<c r="B1" t="e"><v>#N/A</v></c>');
+            expect(sheet).toContain('<c r="C1" t="inlineStr"><is><t>#NOPE</t></is></c>');
+        });
+    });
+
+    describe('xlsx_recalc.py', () => {
+        testFn('checks several files with --batch', async () => {
+            const cleanPath = path.join(testDir, 'clean.xlsx');
+            const errorsPath = path.join(testDir, 'errors.xlsx');
+            runPython(`
+import sys
+from openpyxl import Workbook
+wb = Workbook()
+ws = wb.active
+ws.title = "Clean"
+ws.append(["Item", 1])
+wb.save(sys.argv[1])
+wb = Workbook()
+ws = wb.active
+ws.title = "Calc"
+ws["A1"] = 1
+ws["A2"] = "#DIV/0!"
+ws["B1"] = "=A1/0"
+wb.save(sys.argv[2])
+`, [cleanPath, errorsPath]);
+
+            const result = runScript('xlsx_recalc.py', [
+                '--batch', cleanPath, errorsPath, '--no-recalc', '--json',
+            ]);
+
+            expect(result.exitCode).toBe(0);
+            const results = JSON.parse(result.stdout);
+            expect(results).toEqual([
+                {
+                    file: cleanPath,
+                    status: 'success',
+                    total_errors: 0,
+                    total_formulas: 0,
+                    error_summary: {},
+                    recalculated: false,
+                },
+                {
+                    file: errorsPath,
+                    status: 'errors_found',
+                    total_errors: 1,
+                    total_formulas: 1,
+                    error_summary: { '#DIV/0!': { count: 1, locations: ['Calc!A2'] } },
+                    recalculated: false,
+                },
+            ]);
+
+            // Each batch result matches checking that file on its own
+            for (const { file, ...batchResult } of results) {
+                const single = runScript('xlsx_recalc.py', [file, '--no-recalc', '--json']);
+                expect(JSON.parse(single.stdout)).toEqual(batchResult);
+            }
+        });
+    });
+});